@@ -13,13 +13,25 @@ Search API cost: ~$0.08 (Anthropic web_search for X posts) + $0 for RSS/DDG/Goog
 """
 
 import base64
+import hashlib
+import heapq
+import importlib.util
+import inspect
+import json
+import multiprocessing
 import os
 import re
 import sys
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
-from typing import Optional
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from html import unescape
+from typing import NamedTuple, Optional
 from urllib.parse import quote_plus, urlparse
 
 import feedparser
@@ -34,21 +46,62 @@ from phase1_validator import (
     MAX_AGE_HOURS,
     USER_AGENT,
     REQUEST_TIMEOUT,
+    FEED_PARSE_OPTIONS,
     get_session,
-    extract_publication_date,
+    read_capped_body,
+    decode_body,
+    extract_publication_date_with_method,
     estimate_read_time,
     format_date,
     format_date_iso,
     compute_age_hours,
     deduplicate_candidates,
+    json_loads,
+    SOUP_PARSER,
 )
 
-# Optional: trafilatura for better article text extraction
+# Optional: orjson for faster cache serialization
 try:
-    import trafilatura
-    HAS_TRAFILATURA = True
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_TRAFILATURA = False
+    HAS_ORJSON = False
+
+# Optional: trafilatura for better article text extraction. Imported on
+# first use (_load_trafilatura): it drags in a large dependency tree, every
+# spawned parse worker imports this module, and pages with a JSON-LD
+# articleBody never need it
+HAS_TRAFILATURA = importlib.util.find_spec("trafilatura") is not None
+trafilatura = None
+_TRAFILATURA_FAST: dict = {}
+
+
+def _load_trafilatura() -> bool:
+    """Import trafilatura if not done yet. False if missing or unimportable."""
+    global trafilatura, HAS_TRAFILATURA, _TRAFILATURA_FAST
+    if trafilatura is None and HAS_TRAFILATURA:
+        try:
+            import trafilatura as module
+        except ImportError:
+            HAS_TRAFILATURA = False
+            return False
+        # Skip trafilatura's slow backup extractors (our own fallbacks below
+        # cover a miss); the flag was renamed from no_fallback to fast in 1.10
+        _TRAFILATURA_FAST = (
+            {"fast": True}
+            if "fast" in inspect.signature(module.extract).parameters
+            else {"no_fallback": True}
+        )
+        trafilatura = module
+    return HAS_TRAFILATURA
+
+# Optional: lxml for fast HTML parsing (BeautifulSoup html.parser fallback)
+try:
+    import lxml.etree
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
 
 # Optional: duckduckgo_search for web search (healthcare fallback)
 try:
@@ -57,12 +110,10 @@ try:
 except ImportError:
     HAS_DDGS = False
 
-# Optional: anthropic SDK for web_search (Noteworthy X Posts)
-try:
-    import anthropic as _anthropic_sdk
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+# Optional: anthropic SDK for web_search (Noteworthy X Posts). Imported where
+# the sweep runs: it is most of this module's import time, which every
+# spawned parse worker would otherwise pay
+HAS_ANTHROPIC = importlib.util.find_spec("anthropic") is not None
 
 # Twitter Snowflake epoch (Nov 4, 2010 01:42:54.657 UTC)
 _TWITTER_EPOCH_MS = 1288834974657
@@ -70,6 +121,19 @@ _X_POST_MAX_AGE_HOURS = 72   # 3 days — stale posts aren't useful
 _X_POST_MIN_TITLE_LEN = 50   # Skip short replies/retweets
 _X_POST_MAX_CANDIDATES = 4   # Cap section size
 _X_POST_MAX_PER_HANDLE = 2   # Diversity: no single handle dominates
+_X_BATCH_CONCURRENCY = 3     # web_search batches in flight at once
+
+# x.com status links: handle + numeric status ID (anywhere in a URL / in prose)
+_X_STATUS_RE = re.compile(r"x\.com/(\w+)/status/(\d+)")
+_X_URL_RE = re.compile(r"https?://x\.com/(\w+)/status/(\d+)")
+
+# DDG relative dates: "2 hours ago", "1 day ago"
+_REL_DATE_RE = re.compile(r"(\d+)\s+(hour|day|minute)s?\s+ago", re.IGNORECASE)
+_UNIT_TO_DELTA = {
+    "minute": lambda n: timedelta(minutes=n),
+    "hour": lambda n: timedelta(hours=n),
+    "day": lambda n: timedelta(days=n),
+}
 
 
 def _snowflake_to_datetime(status_id: int) -> datetime:
@@ -78,7 +142,7 @@ def _snowflake_to_datetime(status_id: int) -> datetime:
     return datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
 
 
-def _parse_search_date(date_str: str) -> Optional[datetime]:
+def _parse_search_date(date_str: str, now: Optional[datetime] = None) -> Optional[datetime]:
     """Parse a date string from DDG news or RSS feed into a datetime.
 
     Handles common formats:
@@ -86,6 +150,9 @@ def _parse_search_date(date_str: str) -> Optional[datetime]:
       - RFC 2822 (RSS): "Mon, 23 Feb 2026 12:00:00 GMT"
       - DDG relative: "2 hours ago", "1 day ago"
       - Date only: "2026-02-23"
+
+    Relative dates count back from `now` (default: current UTC time); batch
+    callers pass one timestamp for the whole batch.
     """
     if not date_str:
         return None
@@ -100,30 +167,35 @@ def _parse_search_date(date_str: str) -> Optional[datetime]:
         pass
     # RFC 2822 (RSS feeds)
     try:
-        from email.utils import parsedate_to_datetime
         return parsedate_to_datetime(date_str)
     except (ValueError, TypeError):
         pass
     # DDG relative dates: "X hours ago", "X days ago"
-    relative_match = re.match(r"(\d+)\s+(hour|day|minute)s?\s+ago", date_str, re.IGNORECASE)
+    relative_match = _REL_DATE_RE.match(date_str)
     if relative_match:
         amount = int(relative_match.group(1))
         unit = relative_match.group(2).lower()
-        from datetime import timedelta
-        now = datetime.now(timezone.utc)
-        if unit == "minute":
-            return now - timedelta(minutes=amount)
-        elif unit == "hour":
-            return now - timedelta(hours=amount)
-        elif unit == "day":
-            return now - timedelta(days=amount)
+        return (now or datetime.now(timezone.utc)) - _UNIT_TO_DELTA[unit](amount)
     # Date only
+    return _parse_ymd(date_str[:10])
+
+
+@lru_cache(maxsize=4096)
+def _parse_ymd(s: str) -> Optional[datetime]:
+    """Parse "YYYY-MM-DD" by slicing (strptime re-parses its format on every
+    call). Cached: items in one feed usually share a publication date."""
+    parts = s.split("-")
+    if len(parts) != 3:
+        return None
+    y, m, d = parts
+    # Same field widths strptime("%Y-%m-%d") accepts
+    if not (len(y) == 4 and 0 < len(m) <= 2 and 0 < len(d) <= 2
+            and y.isdigit() and m.isdigit() and d.isdigit()):
+        return None
     try:
-        dt = datetime.strptime(date_str[:10], "%Y-%m-%d")
-        return dt.replace(tzinfo=timezone.utc)
-    except (ValueError, TypeError):
-        pass
-    return None
+        return datetime(int(y), int(m), int(d), tzinfo=timezone.utc)
+    except ValueError:
+        return None
 
 
 # =============================================================================
@@ -184,6 +256,32 @@ TICKET_WATCH_QUERIES = [
     "Shoreline Amphitheatre events 2026",
 ]
 
+
+def _google_news_url(query: str) -> str:
+    return GOOGLE_NEWS_RSS_BASE.format(query=quote_plus(query))
+
+
+# The search queries above are fixed, so encode their feed URLs once at import;
+# ad-hoc queries still go through _google_news_url()
+_GOOGLE_NEWS_URLS = {
+    q: _google_news_url(q)
+    for q in (*HEALTHCARE_SEARCH_QUERIES, *TECH_SEARCH_QUERIES, *GA_SEARCH_QUERIES,
+              *LOCAL_SEARCH_QUERIES, *TICKET_WATCH_QUERIES)
+}
+
+# Processes for the CPU-bound parse half of validation. A page parses in a
+# few ms, so a handful of workers keeps up with the fetch pool; with a single
+# core the pool only adds startup and pickling, and pages parse in-process
+PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Search queries in flight at once. The backends' rate limiters space the
+# calls, so a few threads keep them busy without tying up the fetch pool
+SEARCH_WORKERS = 4
+
+# Politeness cap: at most this many article fetches in flight per host, no
+# matter how wide the fetch pool is
+MAX_FETCHES_PER_HOST = 4
+
 # Known paywall domains
 PAYWALL_DOMAINS = {
     "statnews.com", "wsj.com", "nytimes.com", "ft.com",
@@ -240,79 +338,331 @@ def _log(msg: str):
     print(f"[{ts}] {msg}", file=sys.stderr)
 
 
+# =============================================================================
+# ON-DISK CACHE (conditional-GET validators for RSS feeds, link resolutions)
+# =============================================================================
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
+_FEED_CACHE_PATH = os.path.join(CACHE_DIR, "feeds.json")
+_TECHMEME_CACHE_PATH = os.path.join(CACHE_DIR, "techmeme.json")
+_PARSED_FEEDS_PATH = os.path.join(CACHE_DIR, "parsed_feeds.json")
+_GOOGLE_NEWS_CACHE_PATH = os.path.join(CACHE_DIR, "google_news.json")
+_PAGE_CACHE_PATH = os.path.join(CACHE_DIR, "pages.json")
+_STALE_URLS_PATH = os.path.join(CACHE_DIR, "stale_urls.json")
+_TECHMEME_CACHE_MAX = 2000
+# Article pages kept for conditional re-fetch (bodies are zlib-compressed)
+_PAGE_CACHE_MAX = 1000
+# Resolved Google News links are reused for this long (seconds)
+_GOOGLE_NEWS_CACHE_TTL = 30 * 86400
+# Pages already found stale by their own publication date are not fetched
+# again while they keep turning up in feeds/search (a verified date only
+# gets older). An entry lapses once its URL has gone unseen this long.
+_STALE_URLS_TTL = 14 * 86400
+_STALE_URLS_MAX = 5000
+
+
+def _load_json_cache(path: str) -> dict:
+    """Load a JSON cache file; a missing or corrupt file is just an empty cache."""
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _json_dumps(data) -> bytes:
+    """Compact UTF-8 JSON, via orjson when installed (it rejects what plain
+    JSON can't hold, e.g. lone surrogates from a bad feed; json copes)."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(data)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data).encode()
+
+
+def _save_json_cache(path: str, data: dict) -> None:
+    """Write a JSON cache file atomically. Caching is best-effort: errors are logged."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp, path)
+    except OSError as e:
+        _log(f"  Cache write failed ({os.path.basename(path)}): {e}")
+
+
+def _read_cache_file(name: str, subdir: str = "feeds") -> Optional[bytes]:
+    try:
+        with open(os.path.join(CACHE_DIR, subdir, name), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_cache_file(name: str, body: bytes, subdir: str = "feeds") -> bool:
+    try:
+        os.makedirs(os.path.join(CACHE_DIR, subdir), exist_ok=True)
+        with open(os.path.join(CACHE_DIR, subdir, name), "wb") as f:
+            f.write(body)
+        return True
+    except OSError:
+        return False
+
+
+def _remove_cache_file(name: str, subdir: str = "feeds") -> None:
+    try:
+        os.remove(os.path.join(CACHE_DIR, subdir, name))
+    except OSError:
+        pass
+
+
 # =============================================================================
 # SEARCH BACKENDS (pluggable — swap for SerpAPI/Brave if DDG is unreliable)
 # =============================================================================
 
-class SearchResult:
-    """A single search result."""
-    __slots__ = ("title", "url", "snippet", "source", "date")
+class RateLimiter:
+    """Thread-safe call spacing: grants at most one slot per `interval` seconds.
+
+    Replaces sleep-after-every-call. Callers on different threads queue for
+    the next free slot, so request latency overlaps the cooldown instead of
+    adding to it.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class SearchResult(NamedTuple):
+    """A single search result (immutable; built positionally in the backends)."""
+    title: str = ""
+    url: str = ""
+    snippet: str = ""
+    source: str = ""
+    date: str = ""
+
+
+# Start of the Nth feed item (RSS <item> or Atom <entry>)
+_FEED_ITEM_RE = re.compile(rb"<(?:item|entry)[\s>]")
+
+
+def _read_feed_body(resp: requests.Response, max_items: Optional[int]) -> bytes:
+    """Read a feed body, stopping at the start of item N+1 when `max_items` is set."""
+    if max_items is None:
+        return resp.content
+    # Grown in place; bytes += would copy the whole body on every chunk
+    body = bytearray()
+    seen = 0
+    scan_from = 0
+    for chunk in resp.iter_content(chunk_size=16384):
+        body += chunk
+        # Spans, not match objects: a live match pins the buffer's size
+        for start, end in [m.span() for m in _FEED_ITEM_RE.finditer(body, scan_from)]:
+            seen += 1
+            scan_from = end
+            if seen > max_items:
+                del body[start:]
+                # Re-close RSS 2.0 so feedparser stays on its strict
+                # (fast) parser; other formats fall back to the loose one
+                if b"<rss" in body[:1024]:
+                    body += b"</channel></rss>"
+                return bytes(body)
+        # Rescan the tail next time in case a tag straddles the chunk edge
+        scan_from = max(scan_from, len(body) - 7)
+    return bytes(body)
+
+
+def _fetch_feed(session: requests.Session, url: str, max_items: Optional[int] = None,
+                validators: Optional[dict] = None,
+                parse_cache: Optional["_ParsedFeedCache"] = None):
+    """Fetch and parse an RSS/Atom feed over the shared session.
+
+    Streams the body over the session's keep-alive pool instead of letting
+    feedparser open its own urllib connection per feed. With `max_items`,
+    the download stops at the start of item N+1 and only the first N items
+    reach feedparser (Google News returns up to 100 per query; we keep 10).
+
+    With a `validators` dict (url → ETag/Last-Modified, see _FEED_CACHE_PATH)
+    the request is conditional; a 304 re-parses the body cached on disk from
+    the last 200. With a `parse_cache`, a body seen on an earlier run is not
+    re-parsed at all. Raises on HTTP errors.
+    """
+    parse = parse_cache.parse if parse_cache is not None else _parse_feed_body
+
+    cached = validators.get(url) if validators is not None else None
+    conditional = {}
+    if cached:
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            conditional["If-Modified-Since"] = cached["modified"]
+
+    with session.get(url, timeout=REQUEST_TIMEOUT, stream=True, headers=conditional or None) as resp:
+        if resp.status_code == 304 and cached:
+            body = _read_cache_file(cached["file"])
+            if body is not None:
+                return parse(body, {"content-type": cached.get("content_type", "")})
+        else:
+            resp.raise_for_status()
+            headers = {"content-type": resp.headers.get("content-type", "")}
+            if validators is None and parse_cache is None and max_items is None:
+                resp.raw.decode_content = True
+                return feedparser.parse(resp.raw, response_headers=headers, **FEED_PARSE_OPTIONS)
+
+            body = _read_feed_body(resp, max_items)
+            etag = resp.headers.get("ETag")
+            modified = resp.headers.get("Last-Modified")
+            if validators is not None and (etag or modified):
+                name = hashlib.sha1(url.encode()).hexdigest()[:16] + ".xml"
+                if _write_cache_file(name, body):
+                    validators[url] = {
+                        "etag": etag, "modified": modified,
+                        "content_type": headers["content-type"], "file": name,
+                    }
+            return parse(body, headers)
+
+    # 304 but the cached body is gone: forget the validators and refetch in full
+    validators.pop(url, None)
+    return _fetch_feed(session, url, max_items, validators, parse_cache)
 
-    def __init__(self, title="", url="", snippet="", source="", date=""):
-        self.title = title
-        self.url = url
-        self.snippet = snippet
-        self.source = source
-        self.date = date
+
+def _parse_feed_body(body: bytes, headers: dict):
+    return feedparser.parse(body, response_headers=headers, **FEED_PARSE_OPTIONS)
+
+
+class _ParsedFeedCache:
+    """Feed entries keyed by a hash of the feed body, persisted between runs.
+
+    Feeds often serve byte-identical bodies from one run to the next (or
+    answer 304 with our cached copy), so their parse can be skipped. Only
+    the entry fields _collect_rss reads are kept, and only bodies seen this
+    run are written back.
+    """
+
+    FIELDS = ("title", "link", "published")
+
+    def __init__(self, path: str):
+        self.path = path
+        self._previous = _load_json_cache(path)
+        self._current: dict[str, list] = {}
+
+    def parse(self, body: bytes, headers: dict):
+        key = hashlib.blake2b(body, digest_size=16).hexdigest()
+        entries = self._current.get(key) or self._previous.get(key)
+        if entries is None:
+            feed = feedparser.parse(body, response_headers=headers, **FEED_PARSE_OPTIONS)
+            entries = [{k: e[k] for k in self.FIELDS if k in e} for e in feed.entries]
+        self._current[key] = entries
+        return feedparser.FeedParserDict(
+            entries=[feedparser.FeedParserDict(e) for e in entries],
+        )
+
+    def save(self) -> None:
+        _save_json_cache(self.path, self._current)
 
 
 class GoogleNewsRSSBackend:
     """Free news search via Google News RSS. No API key, no rate limits."""
 
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: requests.Session, min_interval: float = 0.3):
         self.session = session
+        self._limiter = RateLimiter(min_interval)
 
     def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
-        url = GOOGLE_NEWS_RSS_BASE.format(query=quote_plus(query))
+        url = _GOOGLE_NEWS_URLS.get(query) or _google_news_url(query)
+        self._limiter.wait()
         try:
-            feed = feedparser.parse(url)
+            if HAS_LXML:
+                try:
+                    return self._search_iterparse(url, max_results)
+                except lxml.etree.XMLSyntaxError:
+                    pass  # not the plain RSS 2.0 we expect — let feedparser cope
+            feed = _fetch_feed(self.session, url, max_items=max_results)
+            del feed.entries[max_results:]
             results = []
-            for entry in feed.entries[:max_results]:
-                title = entry.get("title", "")
-                source_name = ""
-                # Google News titles: "Article Title - Source Name"
-                if " - " in title:
-                    parts = title.rsplit(" - ", 1)
-                    title = parts[0]
-                    source_name = parts[1] if len(parts) > 1 else ""
-
-                # <source> element is more reliable
-                source_el = entry.get("source", {})
-                if hasattr(source_el, "get"):
-                    source_name = source_el.get("title", source_name) or source_name
-
-                results.append(SearchResult(
-                    title=title,
-                    url=entry.get("link", ""),
-                    snippet=entry.get("summary", ""),
-                    source=source_name,
-                    date=entry.get("published", ""),
+            for entry in feed.entries:
+                get = entry.get
+                # <source> element is more reliable than the title suffix
+                # (feedparser always gives a dict for it)
+                source_el = get("source")
+                source_title = source_el.get("title", "") if source_el else ""
+                results.append(_google_news_result(
+                    get("title", ""), get("link", ""), get("summary", ""),
+                    source_title, get("published", ""),
                 ))
             return results
         except Exception as e:
             _log(f"    Google News RSS error for '{query[:40]}': {e}")
             return []
 
+    def _search_iterparse(self, url: str, max_results: int) -> list[SearchResult]:
+        """Stream <item>s straight off the socket with lxml.
+
+        Google News RSS is well-formed RSS 2.0 and we only need five fields,
+        so this skips feedparser's sanitizing/normalizing machinery, clears
+        each item once read, and stops downloading after `max_results`.
+        """
+        results = []
+        with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            items = lxml.etree.iterparse(
+                resp.raw, tag="item", resolve_entities=False, no_network=True,
+            )
+            for _, item in items:
+                if len(results) >= max_results:
+                    break
+                results.append(_google_news_result(
+                    (item.findtext("title") or "").strip(),
+                    (item.findtext("link") or "").strip(),
+                    item.findtext("description") or "",
+                    (item.findtext("source") or "").strip(),
+                    (item.findtext("pubDate") or "").strip(),
+                ))
+                item.clear()
+        return results
+
+
+def _google_news_result(title: str, link: str, summary: str,
+                        source_title: str, published: str) -> SearchResult:
+    # Google News titles: "Article Title - Source Name"
+    head, sep, tail = title.rpartition(" - ")
+    source_name = tail if sep else ""
+    if sep:
+        title = head
+    return SearchResult(title, link, summary, source_title or source_name, published)
+
 
 class DuckDuckGoBackend:
     """Free web search via DuckDuckGo. No API key. Good for site:x.com queries."""
 
-    def __init__(self):
+    def __init__(self, min_interval: float = 0.8):
         if not HAS_DDGS:
             _log("  Warning: duckduckgo_search not installed (pip install duckduckgo_search)")
+        # One limiter across text + news search: DDG throttles per client
+        self._limiter = RateLimiter(min_interval)
 
     def search(self, query: str, max_results: int = 10) -> list[SearchResult]:
         if not HAS_DDGS:
             return []
+        self._limiter.wait()
         try:
             with DDGS() as ddgs:
                 raw = list(ddgs.text(query, max_results=max_results))
             return [
-                SearchResult(
-                    title=r.get("title", ""),
-                    url=r.get("href", r.get("link", "")),
-                    snippet=r.get("body", ""),
-                )
+                SearchResult(r.get("title", ""), r.get("href", r.get("link", "")), r.get("body", ""))
                 for r in raw
             ]
         except Exception as e:
@@ -322,16 +672,14 @@ class DuckDuckGoBackend:
     def news_search(self, query: str, max_results: int = 10) -> list[SearchResult]:
         if not HAS_DDGS:
             return []
+        self._limiter.wait()
         try:
             with DDGS() as ddgs:
                 raw = list(ddgs.news(query, max_results=max_results))
             return [
                 SearchResult(
-                    title=r.get("title", ""),
-                    url=r.get("url", ""),
-                    snippet=r.get("body", ""),
-                    source=r.get("source", ""),
-                    date=r.get("date", ""),
+                    r.get("title", ""), r.get("url", ""), r.get("body", ""),
+                    r.get("source", ""), r.get("date", ""),
                 )
                 for r in raw
             ]
@@ -344,15 +692,195 @@ class DuckDuckGoBackend:
 # ARTICLE PROCESSING HELPERS
 # =============================================================================
 
+@lru_cache(maxsize=8192)
+def _parse_url(url: str):
+    """Memoized urlparse — the same URL is inspected by several helpers per run."""
+    return urlparse(url)
+
+
+@lru_cache(maxsize=8192)
+def _host(url: str) -> str:
+    """Lowercased host of a URL, without port or credentials (memoized)."""
+    return _parse_url(url).hostname or ""
+
+
+# Signals on Google's redirect interstitial, in the order they are trusted:
+# the first <noscript>'s first link, any data-url attribute, og:url
+_NOSCRIPT_BLOCK_RE = re.compile(r"<noscript\b[^>]*>(.*?)</noscript\s*>", re.IGNORECASE | re.DOTALL)
+_A_TAG_RE = re.compile(r"<a\b[^>]*>", re.IGNORECASE)
+_HREF_ATTR_RE = re.compile(r"\shref\s*=\s*(?:\"([^\"]*)\"|'([^']*)')", re.IGNORECASE)
+_DATA_URL_ATTR_RE = re.compile(
+    r"<[a-z][^<>]*?\s(data-url)\s*=\s*(?:\"([^\"]*)\"|'([^']*)')", re.IGNORECASE,
+)
+_OG_URL_RE = re.compile(
+    r"<meta\b[^<>]*?\sproperty\s*=\s*[\"'](og:url)[\"'][^<>]*?"
+    r"\scontent\s*=\s*(?:\"([^\"]*)\"|'([^']*)')",
+    re.IGNORECASE,
+)
+# Markup a parser doesn't read as tags: (open, close) as lowercase prefixes
+_RAW_TEXT_MARKERS = (("<script", "</script"), ("<style", "</style"), ("<!--", "-->"))
+
+
+def _in_raw_text(lower: str, pos: int) -> bool:
+    """Whether `pos` falls inside a script, style or comment of the page."""
+    return any(lower.rfind(open_, 0, pos) > lower.rfind(close, 0, pos)
+               for open_, close in _RAW_TEXT_MARKERS)
+
+
+def _markup_positions(lower: str, marker: str) -> list[int]:
+    """Offsets of `marker` in the page outside scripts, styles and comments."""
+    positions = []
+    pos = lower.find(marker)
+    while pos >= 0:
+        if not _in_raw_text(lower, pos):
+            positions.append(pos)
+        pos = lower.find(marker, pos + 1)
+    return positions
+
+
+def _scan_redirect_page(page: str) -> Optional[str]:
+    """Pull the article URL out of a Google redirect page without parsing it.
+
+    Only answers when a parse would provably agree (_REDIRECT_XPATHS, in the
+    same order); anything the scan can't account for — a first <noscript>
+    without a quoted link, unclosed blocks, unquoted attributes, markers in
+    text — returns None so the caller parses the page instead.
+    """
+    lower = page.lower()
+
+    # First <noscript> only, and only its first link
+    noscripts = _markup_positions(lower, "<noscript")
+    if noscripts:
+        block = _NOSCRIPT_BLOCK_RE.match(page, noscripts[0])
+        if not block:
+            return None
+        for tag in _A_TAG_RE.finditer(block.group(1)):
+            href = _HREF_ATTR_RE.search(tag.group(0))
+            if href:
+                url = unescape(href.group(1) if href.group(1) is not None else href.group(2))
+                if url and "google.com" not in url:
+                    return url
+                break
+            if "href" in tag.group(0).lower():
+                return None
+        else:
+            return None
+
+    # data-url attributes, in document order; every occurrence of the
+    # marker must be one the tag regex read
+    positions = _markup_positions(lower, "data-url")
+    if positions:
+        attrs = [m for m in _DATA_URL_ATTR_RE.finditer(page)
+                 if not _in_raw_text(lower, m.start())]
+        if [m.start(1) for m in attrs] != positions:
+            return None
+        for m in attrs:
+            url = unescape(m.group(2) if m.group(2) is not None else m.group(3))
+            if not url:
+                return None
+            if "google.com" not in url:
+                return url
+
+    # og:url, trusted only when it is the single one on the page
+    positions = _markup_positions(lower, "og:url")
+    if positions:
+        m = _OG_URL_RE.search(page)
+        if (len(positions) != 1 or not m or m.start(1) != positions[0]
+                or _in_raw_text(lower, m.start())):
+            return None
+        url = unescape(m.group(2) if m.group(2) is not None else m.group(3))
+        if url and "google.com" not in url:
+            return url
+    return None
+
+
+# Google News article ID (_google_news_key) → resolved article URL (or None
+# when resolution failed cleanly). The same story surfaces from several
+# queries before dedup, so this saves repeat redirect round-trips within a
+# run. FIFO-bounded.
+# Successful resolutions also persist across runs (_GOOGLE_NEWS_CACHE_PATH),
+# stamped with when they were first resolved.
+_RESOLVE_CACHE: dict[str, Optional[str]] = {}
+_RESOLVE_CACHE_MAX = 2048
+_RESOLVED_AT: dict[str, float] = {}
+
+
+# Tree fallback for the same three signals, compiled once: first <noscript>'s
+# first link, any data-url attribute, og:url
+_REDIRECT_XPATHS = (
+    lxml.etree.XPath("(//noscript)[1]/descendant::a[@href][1]/@href"),
+    lxml.etree.XPath("//@data-url"),
+    lxml.etree.XPath("//meta[@property='og:url']/@content"),
+) if HAS_LXML else ()
+
+
 def resolve_google_news_url(session: requests.Session, url: str) -> Optional[str]:
     """Resolve a Google News redirect URL to the actual article URL."""
     if "news.google.com" not in url:
         return url
+    key = _google_news_key(url)
+    try:
+        return _RESOLVE_CACHE[key]
+    except KeyError:
+        pass
+
+    resolved, cacheable = _resolve_google_news_url(session, url)
+    if cacheable:
+        if len(_RESOLVE_CACHE) >= _RESOLVE_CACHE_MAX:
+            _RESOLVE_CACHE.pop(next(iter(_RESOLVE_CACHE), None), None)
+        _RESOLVE_CACHE[key] = resolved
+        if resolved:
+            _RESOLVED_AT[key] = time.time()
+    return resolved
 
+
+def _cached_google_news_resolution(url: str) -> tuple[bool, Optional[str]]:
+    """(hit, resolved) from the resolve cache alone, with no network call."""
+    try:
+        return True, _RESOLVE_CACHE[_google_news_key(url)]
+    except KeyError:
+        return False, None
+
+
+def _google_news_key(url: str) -> str:
+    """Resolve-cache key: the /articles/<id> blob, so the same story linked
+    from /rss/articles/ and /articles/ or with different ?hl=/&oc= query
+    strings shares one entry. Other URLs key as themselves."""
+    _, sep, rest = url.partition("/articles/")
+    return rest.partition("?")[0] if sep else url
+
+
+def _load_resolve_cache() -> None:
+    """Reset the resolve cache to the unexpired resolutions saved on disk."""
+    _RESOLVE_CACHE.clear()
+    _RESOLVED_AT.clear()
+    cutoff = time.time() - _GOOGLE_NEWS_CACHE_TTL
+    for key, entry in _load_json_cache(_GOOGLE_NEWS_CACHE_PATH).items():
+        try:
+            resolved, resolved_at = entry
+        except (TypeError, ValueError):
+            continue
+        if resolved and isinstance(resolved_at, (int, float)) and resolved_at >= cutoff:
+            key = _google_news_key(key)
+            _RESOLVE_CACHE[key] = resolved
+            _RESOLVED_AT[key] = resolved_at
+
+
+def _save_resolve_cache() -> None:
+    """Persist the successful resolutions still in the resolve cache."""
+    _save_json_cache(_GOOGLE_NEWS_CACHE_PATH, {
+        key: [resolved, _RESOLVED_AT.get(key, time.time())]
+        for key, resolved in list(_RESOLVE_CACHE.items()) if resolved
+    })
+
+
+def _resolve_google_news_url(session: requests.Session, url: str) -> tuple[Optional[str], bool]:
+    """Uncached resolution. Returns (url_or_None, cacheable); network
+    errors are not cacheable so a transient failure can be retried."""
     # Try 1: decode from the base64 protobuf in the URL path
     decoded = _decode_google_news_url(url)
     if decoded:
-        return decoded
+        return decoded, True
 
     # Try 2: follow HTTP redirects with Google-specific headers
     try:
@@ -365,28 +893,53 @@ def resolve_google_news_url(session: requests.Session, url: str) -> Optional[str
         resp = session.get(url, timeout=15, allow_redirects=True, headers=headers)
         final = resp.url
         if "news.google.com" not in final and "consent.google" not in final:
-            return final
-
-        # Try 3: extract from the Google redirect page HTML
-        soup = BeautifulSoup(resp.text, "html.parser")
+            return final, True
+
+        # Try 3: extract from the Google redirect page HTML — cheap regex
+        # scan first, full parse only when none of the signals match.
+        # Decoded once with the header charset: resp.text re-decodes (and
+        # may run charset detection) on every access
+        html = decode_body(resp.content, resp.encoding)
+        scanned = _scan_redirect_page(html)
+        if scanned:
+            return scanned, True
+        tree = _parse_lxml(html)
+        if tree is not None:
+            for xpath in _REDIRECT_XPATHS:
+                for href in xpath(tree):
+                    if "google.com" not in href:
+                        return str(href), True
+            return None, True
+        soup = BeautifulSoup(html, "html.parser")
         # Check noscript fallback
         noscript = soup.find("noscript")
         if noscript:
             a = noscript.find("a", href=True)
             if a and "google.com" not in a["href"]:
-                return a["href"]
-        # Check data-url attributes
-        for tag in soup.find_all(attrs={"data-url": True}):
+                return a["href"], True
+        # Check data-url attributes (CSS selector, compiled once by soupsieve)
+        for tag in soup.select("[data-url]"):
             if "google.com" not in tag["data-url"]:
-                return tag["data-url"]
+                return tag["data-url"], True
         # Check og:url
         og = soup.find("meta", property="og:url")
         if og and og.get("content") and "google.com" not in og["content"]:
-            return og["content"]
+            return og["content"], True
     except Exception:
-        pass
+        return None, False
 
-    return None
+    return None, True
+
+
+# Bytes allowed in a decoded article URL map to themselves, everything else to
+# NUL, so bytes.translate + split finds the end of the URL in one C-level pass
+_URL_BYTE_TABLE = bytes(
+    b if 32 < b < 127 and chr(b) not in ' "<>{}|\\^`[]' else 0
+    for b in range(256)
+)
+
+
+_B64URL_RE = re.compile(r"[A-Za-z0-9_-]*")
 
 
 def _decode_google_news_url(url: str) -> Optional[str]:
@@ -396,24 +949,24 @@ def _decode_google_news_url(url: str) -> Optional[str]:
         return None
     try:
         encoded = url.split("/articles/")[1].split("?")[0]
-        # Try multiple padding approaches
-        for pad_extra in ["", "=", "==", "==="]:
+        # A clean base64url blob has exactly one valid padding; only blobs
+        # with stray characters need the trial-and-error paddings
+        if _B64URL_RE.fullmatch(encoded):
+            paddings = ("=" * (-len(encoded) % 4),)
+        else:
+            paddings = ("", "=", "==", "===")
+        for pad_extra in paddings:
             try:
                 decoded = base64.urlsafe_b64decode(encoded + pad_extra)
                 # Look for http(s):// in raw decoded bytes
                 idx = decoded.find(b"http")
                 if idx >= 0:
                     # Extract URL bytes until a non-URL character
-                    url_bytes = bytearray()
-                    for b in decoded[idx:]:
-                        if 32 < b < 127 and chr(b) not in ' "<>{}|\\^`[]':
-                            url_bytes.append(b)
-                        else:
-                            break
+                    url_bytes = decoded[idx:].translate(_URL_BYTE_TABLE).split(b"\x00", 1)[0]
                     candidate = url_bytes.decode("ascii", errors="ignore")
                     if candidate.startswith("http") and "google.com" not in candidate:
                         # Basic URL validation
-                        parsed = urlparse(candidate)
+                        parsed = _parse_url(candidate)
                         if parsed.netloc and "." in parsed.netloc:
                             return candidate
             except Exception:
@@ -423,72 +976,461 @@ def _decode_google_news_url(url: str) -> Optional[str]:
     return None
 
 
-def extract_article_text(html: str) -> str:
+_NON_CONTENT_TAGS = ("script", "style", "nav", "header", "footer", "aside",
+                     "figure", "figcaption", "form", "button")
+
+def _fetch_page(session: requests.Session, url: str,
+                validators: Optional[dict] = None,
+                deadline: Optional[float] = None) -> tuple[str, str]:
+    """Download an article page, capped at MAX_HTML_BYTES. Returns (html, final_url).
+
+    With a `validators` dict (url → ETag/Last-Modified, see _PAGE_CACHE_PATH)
+    the request is conditional; a 304 decodes the body cached from the last
+    200 instead of downloading it again. Raises on HTTP errors.
+    """
+    cached = validators.get(url) if validators is not None else None
+    conditional = {}
+    if cached:
+        if cached.get("etag"):
+            conditional["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            conditional["If-Modified-Since"] = cached["modified"]
+
+    with session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True,
+                     stream=True, headers=conditional or None) as resp:
+        if resp.status_code == 304 and cached:
+            stored = _read_cache_file(cached["file"], "pages")
+            try:
+                body = zlib.decompress(stored) if stored is not None else None
+            except zlib.error:
+                body = None
+            if body is not None:
+                # Re-insert so the entry counts as recently used
+                validators[url] = validators.pop(url, cached)
+                return decode_body(body, cached.get("encoding")), cached.get("final_url") or resp.url
+        else:
+            resp.raise_for_status()
+            body, complete = read_capped_body(resp, deadline=deadline)
+            etag = resp.headers.get("ETag")
+            modified = resp.headers.get("Last-Modified")
+            if validators is not None and complete and (etag or modified):
+                name = hashlib.sha1(url.encode()).hexdigest()[:16] + ".html.z"
+                if _write_cache_file(name, zlib.compress(body), "pages"):
+                    validators.pop(url, None)
+                    validators[url] = {
+                        "etag": etag, "modified": modified, "encoding": resp.encoding,
+                        "final_url": resp.url, "file": name,
+                    }
+            return decode_body(body, resp.encoding), resp.url
+
+    # 304 but the cached body is gone: forget the validators and refetch in full
+    validators.pop(url, None)
+    return _fetch_page(session, url, validators, deadline)
+
+
+def _interleave_by_host(candidates: list[dict]) -> list[dict]:
+    """Candidates reordered round-robin across hosts (first-seen order kept
+    within a host), so a run of same-site URLs doesn't park every fetch
+    worker on that site's slot while other hosts sit idle."""
+    by_host: dict[str, list[dict]] = {}
+    for c in candidates:
+        by_host.setdefault(_host(c.get("url", "")), []).append(c)
+    rounds = [iter(group) for group in by_host.values()]
+    ordered = []
+    while rounds:
+        still = []
+        for it in rounds:
+            c = next(it, None)
+            if c is not None:
+                ordered.append(c)
+                still.append(it)
+        rounds = still
+    return ordered
+
+
+def _save_page_cache(validators: dict) -> None:
+    """Persist the most recently used page validators; drop the rest's bodies."""
+    entries = list(validators.items())
+    for _, entry in entries[:-_PAGE_CACHE_MAX]:
+        if isinstance(entry, dict) and entry.get("file"):
+            _remove_cache_file(entry["file"], "pages")
+    _save_json_cache(_PAGE_CACHE_PATH, dict(entries[-_PAGE_CACHE_MAX:]))
+
+
+def _parse_lxml(html: str):
+    """Parse HTML with lxml. Returns None if lxml is unavailable or parsing fails."""
+    if not HAS_LXML or not html:
+        return None
+    try:
+        return lxml.html.fromstring(html)
+    except (ValueError, lxml.etree.ParserError):
+        # e.g. str input carrying an XML encoding declaration
+        return None
+
+
+# "articleBody" string in a page's JSON-LD (schema.org NewsArticle); many
+# large publishers embed the full plain-text body there
+_ARTICLE_BODY_RE = re.compile(r'"articleBody"\s*:\s*"((?:[^"\\]|\\.)*)"')
+# Shorter bodies are usually teasers/descriptions, not the article
+_MIN_ARTICLE_BODY_CHARS = 500
+
+# Window of a large page given to trafilatura, from the first <article>
+_ARTICLE_TAG_RE = re.compile(r"<article\b", re.IGNORECASE)
+_ARTICLE_WINDOW_CHARS = 80_000
+
+
+def _jsonld_article_body(html: str) -> Optional[str]:
+    """Plain-text articleBody from JSON-LD, or None if absent, short or HTML."""
+    m = _ARTICLE_BODY_RE.search(html)
+    if not m:
+        return None
+    try:
+        body = json_loads(f'"{m.group(1)}"')
+    except ValueError:
+        return None
+    body = body.strip()
+    if len(body) < _MIN_ARTICLE_BODY_CHARS or "<" in body:
+        return None
+    return body
+
+
+def extract_article_text(html: str, soup: Optional[BeautifulSoup] = None) -> str:
     """Extract main article body text from HTML.
-    Returns up to ~5000 chars (enough for LLM summarization)."""
-    if HAS_TRAFILATURA:
-        text = trafilatura.extract(html, include_comments=False, include_tables=False)
+    Returns up to ~5000 chars (enough for LLM summarization).
+    A caller-supplied `soup` is used for the fallback and modified in place."""
+    # Fast path: the publisher's own structured copy of the body
+    body = _jsonld_article_body(html)
+    if body:
+        return body[:5000]
+
+    if _load_trafilatura():
+        # trafilatura's cost grows with the page, so on big pages hand it
+        # just the window starting at the first <article>
+        doc = html
+        if len(html) > _ARTICLE_WINDOW_CHARS:
+            m = _ARTICLE_TAG_RE.search(html)
+            if m:
+                doc = html[m.start():m.start() + _ARTICLE_WINDOW_CHARS]
+        text = trafilatura.extract(doc, include_comments=False, include_tables=False,
+                                   **_TRAFILATURA_FAST)
         if text:
             return text[:5000]
 
-    # Fallback: BeautifulSoup
-    soup = BeautifulSoup(html, "html.parser")
-    for tag in soup(["script", "style", "nav", "header", "footer", "aside",
-                      "figure", "figcaption", "form", "button"]):
+    # Fallback 1: lxml (only when the caller has no tree to share)
+    tree = _parse_lxml(html) if soup is None else None
+    if tree is not None:
+        lxml.etree.strip_elements(tree, *_NON_CONTENT_TAGS, with_tail=False)
+        article = tree.find(".//article")
+        container = article if article is not None else tree
+        paragraphs = []
+        total = -2  # length of the joined text so far
+        for p in container.iter("p"):
+            t = " ".join(p.text_content().split())
+            if len(t) > 40:
+                paragraphs.append(t)
+                total += len(t) + 2
+                if total >= 5000:
+                    break
+        return "\n\n".join(paragraphs)[:5000]
+
+    # Fallback 2: BeautifulSoup
+    if soup is None:
+        soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(_NON_CONTENT_TAGS)):
         tag.decompose()
 
     article = soup.find("article")
     container = article if article else soup
-    paragraphs = container.find_all("p")
-    text = "\n\n".join(
-        p.get_text(strip=True) for p in paragraphs
-        if len(p.get_text(strip=True)) > 40
-    )
-    return text[:5000]
+    paragraphs = []
+    total = -2  # length of the joined text so far
+    for p in container.find_all("p"):
+        t = p.get_text(strip=True)
+        if len(t) > 40:
+            paragraphs.append(t)
+            total += len(t) + 2
+            # Only 5000 chars are kept, so stop once they are collected
+            if total >= 5000:
+                break
+    return "\n\n".join(paragraphs)[:5000]
+
+
+# A snippet that is one element wrapping plain text, e.g. the
+# <a href="...">title</a> some feeds put in <title>. Quoted attribute
+# values may contain ">"; script/style are left to the parsers.
+_SINGLE_ELEMENT_RE = re.compile(
+    r"\s*<(?!(?:script|style)\b)([a-zA-Z][\w-]*)"
+    r"(?:\s(?:\"[^\"]*\"|'[^']*'|[^'\">])*)?>([^<\r\x00]*)</\1\s*>\s*"
+)
+
+
+def _html_fragment_text(fragment: str) -> str:
+    """Text of an HTML snippet, equivalent to BS4's get_text(strip=True)."""
+    m = _SINGLE_ELEMENT_RE.fullmatch(fragment)
+    if m:
+        return unescape(m.group(2)).strip()
+    if HAS_LXML:
+        try:
+            el = lxml.html.fragment_fromstring(fragment, create_parent="div")
+            return "".join(t.strip() for t in el.itertext())
+        except (ValueError, lxml.etree.ParserError):
+            pass
+    return BeautifulSoup(fragment, "html.parser").get_text(strip=True)
+
+
+def _techmeme_headline_link(tree, fragment: str) -> Optional[str]:
+    """First external link with headline-length text near the `fragment`
+    anchor of a parsed Techmeme page (lxml twin of the BS4 walk)."""
+    container = tree
+    if fragment:
+        found = (tree.xpath("//div[@id=$f]", f=fragment)
+                 or tree.xpath("//a[@name=$f]", f=fragment))
+        if found:
+            parent = found[0].getparent()
+            container = parent if parent is not None else found[0]
+    for a_tag in container.iterdescendants("a"):
+        href = a_tag.get("href")
+        if (href is not None
+                and href.startswith("http")
+                and "techmeme.com" not in href
+                and len("".join(t.strip() for t in a_tag.itertext())) > 30):
+            return href
+    return None
+
+
+def _techmeme_headline_link_bs4(soup, fragment: str) -> Optional[str]:
+    """_techmeme_headline_link for a BeautifulSoup tree (no lxml)."""
+    container = soup
+    if fragment:
+        anchor = soup.find("div", id=fragment) or soup.find("a", attrs={"name": fragment})
+        if anchor:
+            container = anchor.parent or anchor
+    # Find the first external link with substantial text (the headline link)
+    for a_tag in container.find_all("a", href=True):
+        href = a_tag["href"]
+        text = a_tag.get_text(strip=True)
+        if (href.startswith("http")
+            and "techmeme.com" not in href
+            and len(text) > 30):
+            return href
+    return None
+
+
+def _match_domain_suffix(domain: str, known) -> Optional[str]:
+    """Return the longest suffix of `domain` (on a label boundary) found in `known`.
+
+    "feeds.bbc.co.uk" checks feeds.bbc.co.uk → bbc.co.uk → co.uk → uk, so a
+    lookup costs one hash probe per label instead of a substring scan over
+    every known domain (and "microsoft.com" no longer matches "ft.com").
+    """
+    while domain:
+        if domain in known:
+            return domain
+        _, _, domain = domain.partition(".")
+    return None
+
+
+# Paywall markers looked for in the lowercased page head, one `in` per marker
+_PAYWALL_INDICATORS = (
+    "subscribe to read", "subscribers only", "paywall",
+    "content_tier", "metered", "premium content",
+)
+
+
+# Dot-prefixed so one C-level endswith() on "." + host matches the domain or
+# any subdomain, but never a lookalike ("microsoft.com" vs "ft.com")
+_PAYWALL_SUFFIXES = tuple("." + d for d in PAYWALL_DOMAINS)
+
+
+def is_paywall_domain(url: str) -> bool:
+    """Whether the URL is on a known paywall domain (no page needed)."""
+    return classify_url(url)[1]
 
 
 def detect_paywall(url: str, html: str = "") -> bool:
     """Check if an article URL is behind a paywall."""
-    domain = urlparse(url).netloc.lower()
-    for pd in PAYWALL_DOMAINS:
-        if pd in domain:
-            return True
+    if is_paywall_domain(url):
+        return True
     if html:
         # Check common paywall indicators
-        html_lower = html[:5000].lower()
-        if any(indicator in html_lower for indicator in [
-            "subscribe to read", "subscribers only", "paywall",
-            "content_tier", "metered", "premium content",
-        ]):
-            return True
+        head = html[:5000].lower()
+        for indicator in _PAYWALL_INDICATORS:
+            if indicator in head:
+                return True
     return False
 
 
 def infer_source_from_url(url: str) -> str:
     """Infer source name from URL domain."""
-    domain = urlparse(url).netloc.lower().replace("www.", "")
-    for d, name in DOMAIN_SOURCE_MAP.items():
-        if d in domain:
-            return name
+    return classify_url(url)[0]
+
+
+def classify_url(url: str) -> tuple[str, bool]:
+    """(source name, is a known paywall domain) for a URL, from one memoized
+    per-host lookup shared by infer_source_from_url and is_paywall_domain."""
+    return _classify_host(_host(url))
+
+
+@lru_cache(maxsize=1024)
+def _classify_host(host: str) -> tuple[str, bool]:
+    # Keyed on host, so every article from one site shares the entry.
+    # The suffix walk steps past "www." on its own
+    is_paywall = ("." + host).endswith(_PAYWALL_SUFFIXES)
+    matched = _match_domain_suffix(host, DOMAIN_SOURCE_MAP)
+    if matched:
+        return DOMAIN_SOURCE_MAP[matched], is_paywall
     # Fallback: capitalize first part of domain
-    parts = domain.split(".")
-    return parts[0].title() if parts else "Unknown"
-
-
-def _extract_date_method(html: str, url: str) -> str:
-    """Determine which date extraction method succeeded."""
-    soup = BeautifulSoup(html, "html.parser")
-    if soup.find("meta", property="article:published_time"):
-        return "meta article:published_time"
-    if soup.find("meta", property="og:published_time"):
-        return "meta og:published_time"
-    scripts = soup.find_all("script", type="application/ld+json")
-    for s in scripts:
-        if s.string and "datePublished" in (s.string or ""):
-            return "JSON-LD datePublished"
-    if soup.find("time", datetime=True):
-        return "time tag"
-    return "visible text / heuristic"
+    parts = host.replace("www.", "").split(".")
+    return (parts[0].title() if parts else "Unknown"), is_paywall
+
+
+def _load_stale_urls() -> dict:
+    """Known-stale pages from earlier runs (url → entry), minus lapsed ones."""
+    cutoff = time.time() - _STALE_URLS_TTL
+    return {
+        url: entry for url, entry in _load_json_cache(_STALE_URLS_PATH).items()
+        if isinstance(entry, dict) and entry.get("published")
+        and isinstance(entry.get("seen"), (int, float)) and entry["seen"] >= cutoff
+    }
+
+
+def _save_stale_urls(stale_urls: dict) -> None:
+    """Persist the most recently seen known-stale pages."""
+    recent = sorted(stale_urls.items(), key=lambda item: item[1]["seen"])
+    _save_json_cache(_STALE_URLS_PATH, dict(recent[-_STALE_URLS_MAX:]))
+
+
+def _known_stale_result(candidate: dict, url: str, entry: dict,
+                        delivery_time: datetime) -> Optional[dict]:
+    """The stale verdict for a page found stale on an earlier run, rebuilt
+    against this run's delivery time without fetching the page. None if the
+    entry is unusable or the page would now pass (a back-dated run)."""
+    try:
+        pub_date = datetime.fromisoformat(entry["published"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    age = compute_age_hours(pub_date, delivery_time)
+    if age is None or age <= MAX_AGE_HOURS:
+        return None
+    # Report where the page actually lives, as a fresh fetch would
+    url = entry.get("url") or url
+    source = candidate.get("source", "")
+    if not source or source == "Unknown":
+        source = entry.get("source") or infer_source_from_url(url)
+    return {
+        "headline": candidate.get("headline", "") or entry.get("headline", ""),
+        "url": url,
+        "source": source,
+        "collection_method": candidate.get("collection_method", "unknown"),
+        "is_local": candidate.get("is_local", False),
+        "verified_date": format_date_iso(pub_date),
+        "verified_date_display": format_date(pub_date),
+        "age_hours": age,
+        "date_method": entry.get("method"),
+        "verdict": "REJECT",
+        "rejection_reason": f"Article is {age} hours old (max {MAX_AGE_HOURS})",
+    }
+
+
+def _validate_page(candidate: dict, html: str, final_url: str,
+                   delivery_time: datetime, batch_now: datetime) -> tuple[str, dict]:
+    """Parse half of validation: date, headline and age gate for one fetched page.
+
+    Module-level (picklable) so _validate_concurrent can run it on a process
+    pool. Returns (bucket, result) with bucket in valid/stale/unverified/error.
+    """
+    source = candidate.get("source", "")
+    headline = candidate.get("headline", "")
+    is_local = candidate.get("is_local", False)
+
+    try:
+        # Parse once; every extractor below shares this tree. The
+        # read-only lookups run first since estimate_read_time and
+        # extract_article_text strip tags from it in place.
+        soup = BeautifulSoup(html, SOUP_PARSER)
+
+        # Extract publication date from HTML
+        pub_date, date_method = extract_publication_date_with_method(html, final_url, soup=soup)
+
+        # Extract headline if not provided
+        if not headline:
+            h1 = soup.find("h1")
+            if h1:
+                headline = h1.get_text(strip=True)
+            else:
+                og = soup.find("meta", property="og:title")
+                headline = og["content"] if og and og.get("content") else "Unknown"
+
+        # Infer source from URL if empty
+        if not source or source == "Unknown":
+            source = infer_source_from_url(final_url)
+
+        # Build result. Read time, paywall and body text are only
+        # worth computing (and only added) for articles that pass
+        result = {
+            "headline": headline,
+            "url": final_url,
+            "source": source,
+            "collection_method": candidate.get("collection_method", "unknown"),
+            "is_local": is_local,
+        }
+
+        def passed() -> tuple[str, dict]:
+            result["verdict"] = "PASS"
+            result["estimated_read_time_min"] = estimate_read_time(html, soup=soup)
+            result["has_paywall"] = detect_paywall(final_url, html)
+            result["article_text"] = extract_article_text(html, soup=soup)
+            return "valid", result
+
+        if pub_date:
+            age = compute_age_hours(pub_date, delivery_time)
+            result["verified_date"] = format_date_iso(pub_date)
+            result["verified_date_display"] = format_date(pub_date)
+            result["age_hours"] = age
+            result["date_method"] = date_method
+
+            if age is not None and age <= MAX_AGE_HOURS:
+                return passed()
+            else:
+                result["verdict"] = "REJECT"
+                result["rejection_reason"] = (
+                    f"Article is {age} hours old (max {MAX_AGE_HOURS})"
+                )
+                # Full timestamp for the known-stale store (popped by
+                # _validate_concurrent, never part of the result)
+                result["_published"] = pub_date.isoformat()
+                return "stale", result
+        else:
+            # Fallback: use search result date (from DDG/RSS) if available
+            search_date_str = candidate.get("search_date", "")
+            fallback_date = _parse_search_date(search_date_str, now=batch_now) if search_date_str else None
+            if fallback_date:
+                age = compute_age_hours(fallback_date, delivery_time)
+                result["verified_date"] = format_date_iso(fallback_date)
+                result["verified_date_display"] = format_date(fallback_date)
+                result["age_hours"] = age
+                result["date_method"] = "search_result_fallback"
+
+                if age is not None and age <= MAX_AGE_HOURS:
+                    return passed()
+                else:
+                    result["verdict"] = "REJECT"
+                    result["rejection_reason"] = (
+                        f"Article is {age} hours old (max {MAX_AGE_HOURS}) [search date fallback]"
+                    )
+                    return "stale", result
+
+            result["verified_date"] = None
+            result["age_hours"] = None
+            result["verdict"] = "REJECT"
+            result["rejection_reason"] = "Could not extract publication date"
+            return "unverified", result
+
+    except Exception as e:
+        return "error", {
+            "headline": headline, "url": final_url, "source": source,
+            "verdict": "REJECT", "error": str(e),
+        }
+
 
 
 # =============================================================================
@@ -514,14 +1456,31 @@ _HEALTHCARE_FALLBACK_QUERIES = {
 }
 
 
+_MANDATORY_HEALTHCARE_LOWER = [(s, s.lower()) for s in MANDATORY_HEALTHCARE_SOURCES]
+
+
 def build_healthcare_log(all_articles: list[dict]) -> list[dict]:
     """Build Healthcare Candidate Log showing all 5 mandatory sources."""
+    # Index articles by mandatory source in one pass. Most articles share a
+    # handful of source strings, so each distinct string is lowered and
+    # matched once; article order within each source is preserved.
+    by_source = {source: [] for source in MANDATORY_HEALTHCARE_SOURCES}
+    matched_sources: dict[str, list[str]] = {}
+    for a in all_articles:
+        src = a.get("source", "")
+        hits = matched_sources.get(src)
+        if hits is None:
+            src_lower = src.lower()
+            hits = matched_sources[src] = [
+                source for source, source_lower in _MANDATORY_HEALTHCARE_LOWER
+                if source_lower in src_lower
+            ]
+        for source in hits:
+            by_source[source].append(a)
+
     log = []
     for source in MANDATORY_HEALTHCARE_SOURCES:
-        matches = [
-            a for a in all_articles
-            if source.lower() in a.get("source", "").lower()
-        ]
+        matches = by_source[source]
         if matches:
             # Prefer valid over stale/error
             valid = [m for m in matches if m.get("verdict") == "PASS"]
@@ -559,11 +1518,29 @@ class DataCollector:
     Speed: ~2-4 minutes (concurrent article fetching).
     """
 
-    def __init__(self, max_workers: int = 8):
+    def __init__(self, max_workers: int = 32):
         self.session = get_session()
         self.max_workers = max_workers
         self.delivery_time = datetime.now(timezone.utc)
 
+        # One long-lived, bounded pool for network fetches (reused across phases).
+        # Its threads only wait on sockets (parsing happens off-pool), so it
+        # can be wide; per-host semaphores keep any one site from being hammered.
+        self._fetch_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mb-fetch",
+        )
+        # Search queries wait on the backends' rate limiters, so they get
+        # their own small pool rather than parking fetch workers
+        self._search_pool = ThreadPoolExecutor(
+            max_workers=SEARCH_WORKERS, thread_name_prefix="mb-search",
+        )
+        self._search_futures: dict = {}
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+        self._techmeme_cache: dict[str, str] = {}
+        # Parse processes, started on the first validation pass (_get_parse_pool)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+
         # Search backends
         self.gnews = GoogleNewsRSSBackend(self.session)
         self.ddg = DuckDuckGoBackend() if HAS_DDGS else None
@@ -580,6 +1557,42 @@ class DataCollector:
             "error": 0,
         }
 
+    def close(self) -> None:
+        """Shut down the fetch, search and parse pools and close the HTTP session.
+
+        Searches queued but never collected are canceled.
+        """
+        self._search_pool.shutdown(cancel_futures=True)
+        self._fetch_pool.shutdown(cancel_futures=True)
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+        self.session.close()
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """The parse process pool, created once per collector. None on a
+        single core, where pages are parsed in-process instead."""
+        if self._parse_pool is None and PARSE_WORKERS > 1:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._parse_pool
+
+    def __enter__(self) -> "DataCollector":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        """Per-host semaphore capping concurrent fetches to MAX_FETCHES_PER_HOST."""
+        host = _host(url)
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(MAX_FETCHES_PER_HOST)
+        return slot
+
     def collect_all(self) -> dict:
         """
         Run the full collection pipeline.
@@ -590,6 +1603,20 @@ class DataCollector:
         _log("=" * 60)
         _log("DATA COLLECTION PIPELINE")
         _log("=" * 60)
+        _load_resolve_cache()
+
+        # The X sweep only talks to the Anthropic API and depends on nothing
+        # below, so it runs in the background while the feeds and searches
+        # are collected; its batch lines may interleave with theirs
+        x_sweep = self._fetch_pool.submit(self._collect_noteworthy_x)
+
+        # Likewise queue the news, local and ticket-watch searches now, so
+        # they work through the rate limiters while the RSS feeds download
+        self._search_futures = {}
+        for query in (*HEALTHCARE_SEARCH_QUERIES, *TECH_SEARCH_QUERIES,
+                      *GA_SEARCH_QUERIES, *LOCAL_SEARCH_QUERIES):
+            self._queue_search(query)
+        ticket_futures = self._queue_ticket_watch()
 
         # 1. RSS feeds
         _log("\n[1/6] RSS feeds...")
@@ -605,7 +1632,7 @@ class DataCollector:
 
         # 4. Noteworthy X Posts (Anthropic web_search)
         _log("\n[4/6] Noteworthy X Posts (web_search)...")
-        noteworthy_x = self._collect_noteworthy_x()
+        noteworthy_x = x_sweep.result()
 
         # 5. Local news
         _log("\n[5/6] Local news...")
@@ -613,7 +1640,7 @@ class DataCollector:
 
         # 6. Ticket watch
         _log("\n[6/6] Ticket watch...")
-        ticket_watch = self._collect_ticket_watch()
+        ticket_watch = self._collect_ticket_watch(ticket_futures)
 
         # Merge and deduplicate article candidates
         all_raw = rss + healthcare_fallback + search + local
@@ -623,6 +1650,7 @@ class DataCollector:
         # Validate all articles concurrently (fetch HTML, extract dates, age gate)
         _log("\nValidating articles (concurrent fetch)...")
         validated = self._validate_concurrent(all_raw)
+        _save_resolve_cache()
 
         _log(f"\n{'=' * 60}")
         _log("COLLECTION COMPLETE")
@@ -646,90 +1674,140 @@ class DataCollector:
 
     # ---- RSS FEEDS ----
 
-    def _resolve_techmeme_url(self, techmeme_url: str) -> Optional[str]:
-        """Resolve a Techmeme aggregator URL to the actual source article URL.
+    def _resolve_techmeme_urls(self, page_url: str, techmeme_urls: list[str]) -> dict:
+        """Resolve Techmeme aggregator URLs on one page to the actual source articles.
 
         Techmeme RSS links point to techmeme.com/YYMMDD/pN#aNNNN which are
-        aggregator pages. The actual source article is the first external link
-        with headline text on that page.
+        aggregator pages; several items usually share a page and differ only
+        in the fragment. The actual source article is the first external link
+        with headline text near that anchor. The page is fetched once for all
+        of them, under its host slot. A given link never changes target, so
+        resolutions are remembered across runs (_TECHMEME_CACHE_PATH).
+
+        Returns {techmeme_url: resolved_url} for the URLs that resolved.
         """
+        resolved = {}
+        missing = []
+        for url in techmeme_urls:
+            cached = self._techmeme_cache.get(url)
+            if cached:
+                resolved[url] = cached
+            else:
+                missing.append(url)
+        if not missing:
+            return resolved
+
         try:
-            resp = self.session.get(techmeme_url, timeout=10)
+            with self._host_slot(page_url):
+                resp = self.session.get(page_url, timeout=10)
             if resp.status_code != 200:
-                return None
-            soup = BeautifulSoup(resp.text, "html.parser")
-            # Find the anchor from the fragment (e.g., a260220p12)
-            fragment = techmeme_url.split("#")[-1] if "#" in techmeme_url else ""
-            container = soup
-            if fragment:
-                anchor = soup.find("div", id=fragment) or soup.find("a", attrs={"name": fragment})
-                if anchor:
-                    container = anchor.parent or anchor
-            # Find the first external link with substantial text (the headline link)
-            for a_tag in container.find_all("a", href=True):
-                href = a_tag["href"]
-                text = a_tag.get_text(strip=True)
-                if (href.startswith("http")
-                    and "techmeme.com" not in href
-                    and len(text) > 30):
-                    return href
+                return resolved
+            html = decode_body(resp.content, resp.encoding)
+            tree = _parse_lxml(html)
+            soup = BeautifulSoup(html, "html.parser") if tree is None else None
+            for url in missing:
+                # Find the anchor from the fragment (e.g., a260220p12)
+                fragment = url.split("#")[-1] if "#" in url else ""
+                if tree is not None:
+                    link = _techmeme_headline_link(tree, fragment)
+                else:
+                    link = _techmeme_headline_link_bs4(soup, fragment)
+                if link:
+                    resolved[url] = self._techmeme_cache[url] = link
         except Exception as e:
             _log(f"    Techmeme resolve error: {e}")
-        return None
+        return resolved
 
     def _collect_rss(self) -> list[dict]:
         candidates = []
         self._rss_source_counts = {}  # Track per-source counts for fallback logic
-        for source_name, feed_url in RSS_FEEDS.items():
+        feed_validators = _load_json_cache(_FEED_CACHE_PATH)
+        parsed_feeds = _ParsedFeedCache(_PARSED_FEEDS_PATH)
+        self._techmeme_cache = _load_json_cache(_TECHMEME_CACHE_PATH)
+
+        # Fetch every feed concurrently on the shared pool (conditional GETs
+        # against the validators from the last run)
+        feed_futures = {
+            self._fetch_pool.submit(
+                _fetch_feed, self.session, feed_url, 10, feed_validators, parsed_feeds,
+            ): source_name
+            for source_name, feed_url in RSS_FEEDS.items()
+        }
+
+        # Pass 1: pull (url, headline, date) out of each feed in completion
+        # order, so one slow feed doesn't hold up resolving the Techmeme
+        # aggregator links of the others. Slots are pre-filled so pass 2
+        # still walks RSS_FEEDS order.
+        per_feed: dict[str, object] = dict.fromkeys(RSS_FEEDS)
+        techmeme: dict = {}
+        for future in as_completed(feed_futures):
+            source_name = feed_futures[future]
             try:
-                feed = feedparser.parse(feed_url)
-                count = 0
+                feed = future.result()
+                items = []
+                techmeme_pages: dict[str, list[str]] = {}
                 for entry in feed.entries[:10]:
                     url = entry.get("link", "")
                     headline = entry.get("title", "")
                     # Strip HTML tags from titles (Fierce Healthcare RSS
                     # wraps titles in <a href="..."> tags)
                     if headline and "<" in headline:
-                        headline = BeautifulSoup(headline, "html.parser").get_text(strip=True)
+                        headline = _html_fragment_text(headline)
                     if not url or not headline:
                         continue
-                    # Resolve Techmeme aggregator URLs to actual source articles
-                    rss_date = entry.get("published", "")
-                    if "techmeme.com" in url:
-                        real_url = self._resolve_techmeme_url(url)
-                        if real_url:
-                            actual_source = infer_source_from_url(real_url)
-                            candidate = {
-                                "url": real_url,
-                                "headline": headline,
-                                "source": actual_source,
-                                "collection_method": "rss_techmeme",
-                                "techmeme_url": url,
-                            }
-                        else:
-                            candidate = {
-                                "url": url,
-                                "headline": headline,
-                                "source": source_name,
-                                "collection_method": "rss",
-                            }
-                    else:
-                        candidate = {
-                            "url": url,
-                            "headline": headline,
-                            "source": source_name,
-                            "collection_method": "rss",
-                        }
-                    if rss_date:
-                        candidate["search_date"] = rss_date
-                    candidates.append(candidate)
-                    count += 1
-                self._rss_source_counts[source_name] = count
-                _log(f"  {source_name}: {count} items")
-                self.stats["rss_candidates"] += count
+                    if "techmeme.com" in url and url not in techmeme:
+                        techmeme[url] = None
+                        techmeme_pages.setdefault(url.partition("#")[0], []).append(url)
+                    items.append((url, headline, entry.get("published", "")))
+                # One task per aggregator page, shared by every item on it
+                for page_url, page_items in techmeme_pages.items():
+                    page_future = self._fetch_pool.submit(
+                        self._resolve_techmeme_urls, page_url, page_items,
+                    )
+                    for url in page_items:
+                        techmeme[url] = page_future
+                per_feed[source_name] = items
             except Exception as e:
+                per_feed[source_name] = e
+
+        # Pass 2: build candidates in RSS_FEEDS order
+        for source_name, items in per_feed.items():
+            if isinstance(items, Exception):
                 self._rss_source_counts[source_name] = 0
-                _log(f"  {source_name}: ERROR — {e}")
+                _log(f"  {source_name}: ERROR — {items}")
+                continue
+            count = 0
+            for url, headline, rss_date in items:
+                # Resolve Techmeme aggregator URLs to actual source articles
+                real_url = techmeme[url].result().get(url) if url in techmeme else None
+                if real_url:
+                    candidate = {
+                        "url": real_url,
+                        "headline": headline,
+                        "source": infer_source_from_url(real_url),
+                        "collection_method": "rss_techmeme",
+                        "techmeme_url": url,
+                    }
+                else:
+                    candidate = {
+                        "url": url,
+                        "headline": headline,
+                        "source": source_name,
+                        "collection_method": "rss",
+                    }
+                if rss_date:
+                    candidate["search_date"] = rss_date
+                candidates.append(candidate)
+                count += 1
+            self._rss_source_counts[source_name] = count
+            _log(f"  {source_name}: {count} items")
+            self.stats["rss_candidates"] += count
+
+        _save_json_cache(_FEED_CACHE_PATH, feed_validators)
+        parsed_feeds.save()
+        # Keep only the most recent resolutions (dicts preserve insertion order)
+        recent = list(self._techmeme_cache.items())[-_TECHMEME_CACHE_MAX:]
+        _save_json_cache(_TECHMEME_CACHE_PATH, dict(recent))
         return candidates
 
     # ---- HEALTHCARE RSS FALLBACK ----
@@ -743,7 +1821,9 @@ class DataCollector:
         if not self.ddg or not HAS_DDGS:
             return []
 
-        candidates = []
+        # Queue every fallback query at once on the search pool; the DDG
+        # backend's rate limiter spaces the actual calls
+        futures = {}
         for source_name in MANDATORY_HEALTHCARE_SOURCES:
             rss_count = self._rss_source_counts.get(source_name, 0)
             if rss_count > 0:
@@ -752,11 +1832,15 @@ class DataCollector:
             site_query = _HEALTHCARE_FALLBACK_QUERIES.get(source_name)
             if not site_query:
                 continue
+            futures[source_name] = self._search_pool.submit(
+                self.ddg.news_search, site_query, max_results=5,
+            )
 
+        candidates = []
+        for source_name, future in futures.items():
             _log(f"  {source_name}: RSS returned 0 — trying DDG news fallback")
             try:
-                results = self.ddg.news_search(site_query, max_results=5)
-                time.sleep(0.8)
+                results = future.result()
                 count = 0
                 for r in results:
                     if r.url and r.title:
@@ -778,6 +1862,24 @@ class DataCollector:
 
     # ---- NEWS SEARCH ----
 
+    def _queue_search(self, query: str):
+        """Future for _search_news(query) on the search pool (submitted once)."""
+        future = self._search_futures.get(query)
+        if future is None:
+            future = self._search_futures[query] = self._search_pool.submit(
+                self._search_news, query,
+            )
+        return future
+
+    def _search_news(self, query: str) -> list[SearchResult]:
+        """DDG news for one query (real URLs), Google News RSS if that comes back empty."""
+        results = []
+        if self.ddg and HAS_DDGS:
+            results = self.ddg.news_search(query, max_results=5)
+        if not results:
+            results = self.gnews.search(query, max_results=5)
+        return results
+
     def _collect_news_search(self) -> list[dict]:
         """Search for additional articles via DDG news (real URLs) or Google News RSS."""
         candidates = []
@@ -788,19 +1890,18 @@ class DataCollector:
             ("GA", GA_SEARCH_QUERIES),
         ]
 
+        # Queries were queued at the start of collect_all (queued here if
+        # not); results are consumed in the original order
+        futures = {
+            query: self._queue_search(query)
+            for _, queries in query_groups for query in queries
+        }
+
         for group_name, queries in query_groups:
             _log(f"  {group_name} queries...")
             group_count = 0
             for query in queries:
-                results = []
-                # Prefer DDG news search (returns real URLs, not Google redirects)
-                if self.ddg and HAS_DDGS:
-                    results = self.ddg.news_search(query, max_results=5)
-                    time.sleep(0.8)  # DDG rate limit
-                # Fallback to Google News RSS
-                if not results:
-                    results = self.gnews.search(query, max_results=5)
-                    time.sleep(0.3)
+                results = futures[query].result()
 
                 for r in results:
                     # Skip Google News redirect URLs (can't be resolved reliably)
@@ -859,7 +1960,9 @@ class DataCollector:
             ]
             return result
 
-        client = _anthropic_sdk.Anthropic(api_key=api_key)
+        import anthropic
+
+        client = anthropic.Anthropic(api_key=api_key)
         now = self.delivery_time
         year = now.strftime("%Y")
         date_str = now.strftime("%B %d, %Y")
@@ -874,10 +1977,7 @@ class DataCollector:
         seen_status_ids = set()
         all_posts = []
 
-        for batch_num, batch_handles in enumerate(FROM_X_SEARCH_BATCHES, 1):
-            handles_str = ", ".join(f"@{h}" for h in batch_handles)
-            _log(f"  Batch {batch_num}/{len(FROM_X_SEARCH_BATCHES)}: {handles_str}")
-
+        def search_batch(batch_handles: list[str]):
             site_clauses = " OR ".join(
                 f"site:x.com/{h}/status" for h in batch_handles
             )
@@ -890,58 +1990,70 @@ class DataCollector:
                 f"2. ({handle_names}) x.com/status {year}\n\n"
                 f"Return every x.com URL you find."
             )
+            return client.messages.create(
+                model="claude-haiku-4-5-20251001",
+                max_tokens=1024,
+                messages=[{"role": "user", "content": query}],
+                tools=[search_tool],
+            )
 
-            try:
-                response = client.messages.create(
-                    model="claude-haiku-4-5-20251001",
-                    max_tokens=1024,
-                    messages=[{"role": "user", "content": query}],
-                    tools=[search_tool],
-                )
-
-                # Track search usage
-                usage = response.usage
-                srv = getattr(usage, "server_tool_use", None)
-                if srv and hasattr(srv, "web_search_requests"):
-                    result["sweep_report"]["total_search_calls"] += srv.web_search_requests
-                else:
-                    result["sweep_report"]["total_search_calls"] += 1
-
-                # Extract x.com URLs from search results
-                for block in response.content:
-                    if getattr(block, "type", None) == "web_search_tool_result":
-                        for r in block.content:
-                            self._process_x_result(
-                                getattr(r, "url", ""),
-                                getattr(r, "title", ""),
-                                now, seen_status_ids, handles_with_results, all_posts,
-                            )
-                    # Also extract URLs from text response
-                    elif getattr(block, "type", None) == "text":
-                        for match in re.finditer(
-                            r"https?://x\.com/(\w+)/status/(\d+)", block.text
-                        ):
-                            url = f"https://x.com/{match.group(1)}/status/{match.group(2)}"
-                            self._process_x_result(
-                                url, "(from text)", now,
-                                seen_status_ids, handles_with_results, all_posts,
-                            )
-
-            except Exception as e:
-                _log(f"    Error: {e}")
+        # Run the batches concurrently (bounded), then fold their responses
+        # in batch order so dedup and post order match a sequential sweep
+        with ThreadPoolExecutor(
+            max_workers=_X_BATCH_CONCURRENCY, thread_name_prefix="mb-xsearch",
+        ) as pool:
+            futures = []
+            for batch_num, batch_handles in enumerate(FROM_X_SEARCH_BATCHES, 1):
+                handles_str = ", ".join(f"@{h}" for h in batch_handles)
+                _log(f"  Batch {batch_num}/{len(FROM_X_SEARCH_BATCHES)}: {handles_str}")
+                futures.append(pool.submit(search_batch, batch_handles))
+
+            for future in futures:
+                try:
+                    response = future.result()
 
-            time.sleep(0.5)
+                    # Track search usage
+                    usage = response.usage
+                    srv = getattr(usage, "server_tool_use", None)
+                    if srv and hasattr(srv, "web_search_requests"):
+                        result["sweep_report"]["total_search_calls"] += srv.web_search_requests
+                    else:
+                        result["sweep_report"]["total_search_calls"] += 1
+
+                    # Extract x.com URLs from search results
+                    for block in response.content:
+                        if getattr(block, "type", None) == "web_search_tool_result":
+                            for r in block.content:
+                                self._process_x_result(
+                                    getattr(r, "url", ""),
+                                    getattr(r, "title", ""),
+                                    now, seen_status_ids, handles_with_results, all_posts,
+                                )
+                        # Also extract URLs from text response
+                        elif getattr(block, "type", None) == "text":
+                            for match in _X_URL_RE.finditer(block.text):
+                                url = f"https://x.com/{match.group(1)}/status/{match.group(2)}"
+                                self._process_x_result(
+                                    url, "(from text)", now,
+                                    seen_status_ids, handles_with_results, all_posts,
+                                )
 
-        # Sort by recency, enforce per-handle cap, then global cap
-        all_posts.sort(key=lambda p: p["age_hours"])
-        handle_counts: dict[str, int] = {}
-        filtered = []
-        for post in all_posts:
-            h = post["handle"]
-            handle_counts[h] = handle_counts.get(h, 0) + 1
-            if handle_counts[h] <= _X_POST_MAX_PER_HANDLE:
-                filtered.append(post)
-        result["candidates"] = filtered[:_X_POST_MAX_CANDIDATES]
+                except Exception as e:
+                    _log(f"    Error: {e}")
+
+        # Keep the freshest few per handle, then the freshest overall. The
+        # index breaks age ties in discovery order, as a stable sort would.
+        by_handle: dict[str, list] = {}
+        for i, post in enumerate(all_posts):
+            by_handle.setdefault(post["handle"], []).append((post["age_hours"], i, post))
+        capped = [
+            entry
+            for entries in by_handle.values()
+            for entry in heapq.nsmallest(_X_POST_MAX_PER_HANDLE, entries)
+        ]
+        result["candidates"] = [
+            post for _, _, post in heapq.nsmallest(_X_POST_MAX_CANDIDATES, capped)
+        ]
 
         result["sweep_report"]["handles_with_results"] = sorted(handles_with_results)
         result["sweep_report"]["handles_no_results"] = [
@@ -966,9 +2078,9 @@ class DataCollector:
             return
 
         # Normalize URL
-        clean_url = re.sub(r"\?.*$", "", url).replace("mobile.x.com", "x.com")
+        clean_url = url.partition("?")[0].replace("mobile.x.com", "x.com")
 
-        match = re.search(r"x\.com/(\w+)/status/(\d+)", clean_url)
+        match = _X_STATUS_RE.search(clean_url)
         if not match:
             return
 
@@ -1011,15 +2123,9 @@ class DataCollector:
 
     def _collect_local(self) -> list[dict]:
         candidates = []
-        for query in LOCAL_SEARCH_QUERIES:
-            results = []
-            # Prefer DDG news for real URLs
-            if self.ddg and HAS_DDGS:
-                results = self.ddg.news_search(query, max_results=5)
-                time.sleep(0.8)
-            if not results:
-                results = self.gnews.search(query, max_results=5)
-                time.sleep(0.3)
+        futures = [(query, self._queue_search(query)) for query in LOCAL_SEARCH_QUERIES]
+        for query, future in futures:
+            results = future.result()
 
             for r in results:
                 if "news.google.com" in r.url:
@@ -1038,19 +2144,30 @@ class DataCollector:
 
     # ---- TICKET WATCH ----
 
-    def _collect_ticket_watch(self) -> dict:
+    def _queue_ticket_watch(self) -> list:
+        """(query, future) per ticket-watch query on the search pool; the
+        future is None without a DDG backend."""
+        return [
+            (query, self._search_pool.submit(self.ddg.search, query, max_results=3)
+             if self.ddg else None)
+            for query in TICKET_WATCH_QUERIES
+        ]
+
+    def _collect_ticket_watch(self, futures: Optional[list] = None) -> dict:
         watch = {}
-        for query in TICKET_WATCH_QUERIES:
+        # All queries go out together (normally queued by collect_all); the
+        # DDG backend's rate limiter spaces the calls. Results are consumed
+        # in query order.
+        if futures is None:
+            futures = self._queue_ticket_watch()
+        for query, future in futures:
             # Extract artist/venue name
             if '"' in query:
                 key = query.split('"')[1]
             else:
                 key = query[:30]
 
-            results = []
-            if self.ddg:
-                results = self.ddg.search(query, max_results=3)
-                time.sleep(0.5)
+            results = future.result() if future else []
 
             if results:
                 watch[key] = {
@@ -1073,16 +2190,31 @@ class DataCollector:
         """Fetch and validate all candidates concurrently."""
         buckets = {"valid": [], "stale": [], "unverified": [], "error": []}
         total = len(candidates)
-
-        def validate_one(candidate: dict) -> tuple[str, dict]:
+        # Anchor for relative search dates ("2 hours ago") across the batch
+        batch_now = datetime.now(timezone.utc)
+        # ETag/Last-Modified per article URL from earlier runs
+        page_validators = _load_json_cache(_PAGE_CACHE_PATH)
+        # Pages earlier runs already found stale
+        stale_urls = _load_stale_urls()
+
+        def fetch_one(candidate: dict) -> tuple[str, dict]:
+            """Network half of validation: resolve redirects and download the page.
+
+            Runs on the fetch pool; parsing happens separately (_validate_page,
+            on the parse processes when there are any) so fetch threads only
+            ever hold in-flight responses.
+            """
             url = candidate.get("url", "")
             source = candidate.get("source", "")
             headline = candidate.get("headline", "")
-            is_local = candidate.get("is_local", False)
 
-            # Resolve Google News redirect URLs
+            # Resolve Google News redirect URLs. Cached resolutions (most of
+            # them on a repeat run) skip the news.google.com slot entirely
             if "news.google.com" in url:
-                resolved = resolve_google_news_url(self.session, url)
+                hit, resolved = _cached_google_news_resolution(url)
+                if not hit:
+                    with self._host_slot(url):
+                        resolved = resolve_google_news_url(self.session, url)
                 if resolved:
                     url = resolved
                 else:
@@ -1093,84 +2225,23 @@ class DataCollector:
                         "error": "Could not resolve Google News redirect",
                     }
 
+            # Known stale from an earlier run: rebuild the verdict, skip the fetch
+            entry = stale_urls.get(url)
+            if entry:
+                result = _known_stale_result(candidate, url, entry, self.delivery_time)
+                if result:
+                    entry["seen"] = time.time()
+                    return "stale", result
+
             try:
-                resp = self.session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-                resp.raise_for_status()
-                html = resp.text
-                final_url = resp.url
-
-                # Extract publication date from HTML
-                pub_date = extract_publication_date(html, final_url)
-
-                # Extract headline if not provided
-                if not headline:
-                    soup = BeautifulSoup(html, "html.parser")
-                    h1 = soup.find("h1")
-                    if h1:
-                        headline = h1.get_text(strip=True)
-                    else:
-                        og = soup.find("meta", property="og:title")
-                        headline = og["content"] if og and og.get("content") else "Unknown"
-
-                # Infer source from URL if empty
-                if not source or source == "Unknown":
-                    source = infer_source_from_url(final_url)
-
-                # Build result
-                result = {
-                    "headline": headline,
-                    "url": final_url,
-                    "source": source,
-                    "estimated_read_time_min": estimate_read_time(html),
-                    "has_paywall": detect_paywall(final_url, html),
-                    "article_text": extract_article_text(html),
-                    "collection_method": candidate.get("collection_method", "unknown"),
-                    "is_local": is_local,
+                with self._host_slot(url):
+                    # Overall budget for the body, like an end-to-end timeout
+                    deadline = time.monotonic() + REQUEST_TIMEOUT
+                    html, final_url = _fetch_page(self.session, url, page_validators, deadline)
+                return "fetched", {
+                    "candidate": candidate, "html": html,
+                    "final_url": final_url, "request_url": url,
                 }
-
-                if pub_date:
-                    age = compute_age_hours(pub_date.isoformat(), self.delivery_time)
-                    result["verified_date"] = format_date_iso(pub_date)
-                    result["verified_date_display"] = format_date(pub_date)
-                    result["age_hours"] = age
-                    result["date_method"] = _extract_date_method(html, final_url)
-
-                    if age is not None and age <= MAX_AGE_HOURS:
-                        result["verdict"] = "PASS"
-                        return "valid", result
-                    else:
-                        result["verdict"] = "REJECT"
-                        result["rejection_reason"] = (
-                            f"Article is {age} hours old (max {MAX_AGE_HOURS})"
-                        )
-                        return "stale", result
-                else:
-                    # Fallback: use search result date (from DDG/RSS) if available
-                    search_date_str = candidate.get("search_date", "")
-                    fallback_date = _parse_search_date(search_date_str) if search_date_str else None
-                    if fallback_date:
-                        age = compute_age_hours(fallback_date.isoformat(), self.delivery_time)
-                        result["verified_date"] = format_date_iso(fallback_date)
-                        result["verified_date_display"] = format_date(fallback_date)
-                        result["age_hours"] = age
-                        result["date_method"] = "search_result_fallback"
-
-                        if age is not None and age <= MAX_AGE_HOURS:
-                            result["verdict"] = "PASS"
-                            return "valid", result
-                        else:
-                            result["verdict"] = "REJECT"
-                            result["rejection_reason"] = (
-                                f"Article is {age} hours old (max {MAX_AGE_HOURS}) [search date fallback]"
-                            )
-                            return "stale", result
-
-                    result["verified_date"] = None
-                    result["age_hours"] = None
-                    result["verdict"] = "REJECT"
-                    result["rejection_reason"] = "Could not extract publication date"
-                    return "unverified", result
-
             except requests.RequestException as e:
                 return "error", {
                     "headline": headline, "url": url, "source": source,
@@ -1182,34 +2253,98 @@ class DataCollector:
                     "verdict": "REJECT", "error": str(e),
                 }
 
-        # Run with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {executor.submit(validate_one, c): c for c in candidates}
-            done_count = 0
-
-            for future in as_completed(futures):
-                done_count += 1
+        def record(category: str, result: dict, request_url: str = "") -> None:
+            nonlocal done_count
+            done_count += 1
+            published = result.pop("_published", None)
+            if published:
+                entry = {
+                    "url": result["url"],
+                    "published": published, "method": result.get("date_method"),
+                    "headline": result.get("headline"), "source": result.get("source"),
+                    "seen": time.time(),
+                }
+                # fetch_one looks pages up by the URL it was about to fetch;
+                # result["url"] is where redirects ended up, so store both
+                for key in {request_url or result["url"], result["url"]}:
+                    stale_urls[key] = entry
+            buckets[category].append(result)
+            if category == "valid":
+                _log(
+                    f"  [{done_count}/{total}] ✓ "
+                    f"{result.get('source', '?')}: "
+                    f"{result.get('headline', '?')[:50]}..."
+                )
+            elif category == "stale":
+                _log(
+                    f"  [{done_count}/{total}] ✗ STALE "
+                    f"{result.get('source', '?')}: "
+                    f"{result.get('headline', '?')[:50]}..."
+                )
+            # Silently count errors and unverified to reduce noise
+
+        def validation_exception(e: Exception) -> None:
+            nonlocal done_count, exception_count
+            done_count += 1
+            exception_count += 1
+            _log(f"  [{done_count}/{total}] ✗ Validation exception: {e}")
+
+        # Fetch on the shared thread pool; as each download lands, hand the
+        # page to the parse processes so parsing stays off the GIL the fetch
+        # threads need. Workers start with the first pages, while most
+        # fetches are still in flight. Hosts are interleaved so workers
+        # rarely wait on a per-host slot.
+        parse_pool = self._get_parse_pool()
+        futures = [self._fetch_pool.submit(fetch_one, c)
+                   for c in _interleave_by_host(candidates)]
+        done_count = 0
+        exception_count = 0
+        parse_futures = {}
+
+        for future in as_completed(futures):
+            try:
+                category, result = future.result()
+            except Exception as e:
+                validation_exception(e)
+                continue
+            if category != "fetched":
+                record(category, result)
+                continue
+            # Popped, not read, so the finished fetch future stops
+            # referencing the page
+            args = (result.pop("candidate"), result.pop("html"), result["final_url"],
+                    self.delivery_time, batch_now)
+            request_url = result["request_url"]
+            if parse_pool is None:
+                record(*_validate_page(*args), request_url)
+                continue
+            try:
+                parse_futures[parse_pool.submit(_validate_page, *args)] = (args, request_url)
+            except BrokenProcessPool:
+                record(*_validate_page(*args), request_url)
+
+        for future in as_completed(parse_futures):
+            # Drop the page from the map once its result is in, so HTML
+            # is only held for parses still outstanding
+            args, request_url = parse_futures.pop(future)
+            try:
                 try:
                     category, result = future.result()
-                    buckets[category].append(result)
-                    self.stats[category] += 1
-                    if category == "valid":
-                        _log(
-                            f"  [{done_count}/{total}] ✓ "
-                            f"{result.get('source', '?')}: "
-                            f"{result.get('headline', '?')[:50]}..."
-                        )
-                    elif category == "stale":
-                        _log(
-                            f"  [{done_count}/{total}] ✗ STALE "
-                            f"{result.get('source', '?')}: "
-                            f"{result.get('headline', '?')[:50]}..."
-                        )
-                    # Silently count errors and unverified to reduce noise
-                except Exception as e:
-                    _log(f"  [{done_count}/{total}] ✗ Validation exception: {e}")
-                    self.stats["error"] += 1
+                except BrokenProcessPool:
+                    # Workers could not start or died: parse here instead
+                    category, result = _validate_page(*args)
+                record(category, result, request_url)
+            except Exception as e:
+                validation_exception(e)
+
+        _save_page_cache(page_validators)
+        _save_stale_urls(stale_urls)
 
+        # Tally once the loop is done rather than per result; exceptions
+        # count as errors but have no result to bucket
+        for category, results in buckets.items():
+            self.stats[category] += len(results)
+        self.stats["error"] += exception_count
         self.stats["total_validated"] = total
 
         # Summary of errors (avoid per-item spam)
@@ -1241,12 +2376,12 @@ if __name__ == "__main__":
     if not HAS_ANTHROPIC:
         _log("⚠ anthropic not installed — Noteworthy X posts will be skipped")
         _log("  Install: pip install anthropic\n")
-    if not HAS_TRAFILATURA:
+    if not _load_trafilatura():
         _log("⚠ trafilatura not installed — using BeautifulSoup for text extraction")
         _log("  Install: pip install trafilatura\n")
 
-    collector = DataCollector()
-    results = collector.collect_all()
+    with DataCollector() as collector:
+        results = collector.collect_all()
 
     print(f"\n{'=' * 40}")
     print(f"RESULTS SUMMARY")
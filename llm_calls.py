@@ -18,10 +18,14 @@ Haiku tasks: relevance scoring, article summaries, GA one-liners, Noteworthy X s
 Sonnet tasks: So Whats, Today in 30 Seconds, quality review
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Optional
 
@@ -31,6 +35,14 @@ try:
 except ImportError:
     HAS_ANTHROPIC = False
 
+# Optional: h2 lets the API client speak HTTP/2, multiplexing concurrent
+# calls over one connection instead of opening a TLS connection per call
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
 # Model IDs
 HAIKU_MODEL = "claude-haiku-4-5-20251001"
 SONNET_MODEL = "claude-sonnet-4-5-20250929"
@@ -41,6 +53,37 @@ HAIKU_OUTPUT_COST = 4.00
 SONNET_INPUT_COST = 3.00
 SONNET_OUTPUT_COST = 15.00
 
+# Per-token (input, output) cost by model; other models are priced as Sonnet
+COST_PER_TOKEN = {
+    HAIKU_MODEL: (HAIKU_INPUT_COST / 1_000_000, HAIKU_OUTPUT_COST / 1_000_000),
+    SONNET_MODEL: (SONNET_INPUT_COST / 1_000_000, SONNET_OUTPUT_COST / 1_000_000),
+}
+
+# Prompt caching multipliers on the input price: writing a cached prefix
+# costs 1.25x, reading it back 0.1x
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+# Independent per-item calls (summaries, So Whats, GA one-liners, X posts)
+# in flight at once. The SDK retries 429s with backoff, so this only needs
+# to stay comfortably under the account's rate limits.
+LLM_CONCURRENCY = 8
+
+# Exact-match response cache for reruns on the same articles. Only calls at
+# or below LLM_CACHE_MAX_TEMPERATURE are replayed (summaries, headlines, GA,
+# X posts, rankings); the warmer So What calls always go to the API.
+LLM_CACHE_PATH = os.path.join(os.path.dirname(__file__), "cache", "llm_responses.json")
+LLM_CACHE_MAX_TEMPERATURE = 0.3
+LLM_CACHE_TTL = 7 * 86400
+LLM_CACHE_MAX_ENTRIES = 2000
+
+# Message Batches API (opt-in for GA one-liners): half price, asynchronous.
+# If the batch hasn't ended by the timeout it is canceled and the missing
+# items go through the regular synchronous path.
+BATCH_DISCOUNT = 0.5
+BATCH_POLL_SECONDS = 30
+BATCH_TIMEOUT = 45 * 60
+
 
 def _log(msg: str):
     ts = datetime.now().strftime("%H:%M:%S")
@@ -112,7 +155,7 @@ SO_WHAT_EXAMPLES = """## Example So Whats (calibrate your tone and specificity t
 class LLMClient:
     """Wrapper for Anthropic API calls with cost tracking."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, use_cache: bool = True):
         if not HAS_ANTHROPIC:
             raise RuntimeError(
                 "anthropic package not installed. Run: pip install anthropic"
@@ -122,21 +165,40 @@ class LLMClient:
             raise RuntimeError(
                 "ANTHROPIC_API_KEY not set. Export it or pass api_key="
             )
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+        self.client = _shared_anthropic_client(self.api_key)
+        # Calls run on several threads; usage totals are updated under this
+        self._usage_lock = threading.Lock()
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cache_write_tokens = 0
+        self.total_cache_read_tokens = 0
         self.total_cost = 0.0
         self.call_count = 0
+        self.cache_hits = 0
+        # key -> {"text": response, "ts": epoch seconds}; None when disabled
+        self.cache = _load_llm_cache() if use_cache else None
 
     def _call(
         self,
         model: str,
-        system: str,
+        system: str | list[dict],
         user: str,
         max_tokens: int = 4096,
         temperature: float = 0.3,
+        cache_if=None,
     ) -> str:
-        """Make a single API call and return the text response."""
+        """Make a single API call and return the text response.
+
+        `system` is a plain string or a list of content blocks (see
+        _cached_system for marking a static prompt cacheable). When given,
+        `cache_if(text)` must be True for the response to be cached, so a
+        malformed reply isn't replayed on later runs.
+        """
+        key = self._cache_key(model, system, user, max_tokens, temperature)
+        hit = self._cached_response(key)
+        if hit is not None:
+            return hit
+
         msg = self.client.messages.create(
             model=model,
             max_tokens=max_tokens,
@@ -144,66 +206,302 @@ class LLMClient:
             system=system,
             messages=[{"role": "user", "content": user}],
         )
-        # Track tokens
-        input_tokens = msg.usage.input_tokens
-        output_tokens = msg.usage.output_tokens
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.call_count += 1
+        text = msg.content[0].text
+        if key is not None and cache_if is not None and not cache_if(text):
+            key = None
+        self._record(model, msg.usage, text, key)
+        return text
 
-        # Calculate cost
-        if model == HAIKU_MODEL:
-            cost = (
-                input_tokens / 1_000_000 * HAIKU_INPUT_COST
-                + output_tokens / 1_000_000 * HAIKU_OUTPUT_COST
-            )
-        else:
-            cost = (
-                input_tokens / 1_000_000 * SONNET_INPUT_COST
-                + output_tokens / 1_000_000 * SONNET_OUTPUT_COST
-            )
-        self.total_cost += cost
+    def _call_stream(
+        self,
+        model: str,
+        system: str | list[dict],
+        user: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+        stop_when=None,
+        stop_window: int = 0,
+    ) -> str:
+        """Like _call, but streams the response.
+
+        `stop_when(text_so_far)` is checked as text arrives; once it returns
+        True the stream is closed (ending generation) and the partial text
+        is returned. Only use it for checks that can't be un-failed by more
+        text, like a refusal pattern that has already appeared.
+
+        With `stop_window` (the longest match stop_when looks for), each
+        check only sees that much text before the new delta plus the delta,
+        rather than everything so far.
+        """
+        key = self._cache_key(model, system, user, max_tokens, temperature)
+        hit = self._cached_response(key)
+        if hit is not None:
+            return hit
+
+        text = ""
+        with self.client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system,
+            messages=[{"role": "user", "content": user}],
+        ) as stream:
+            for delta in stream.text_stream:
+                text += delta
+                if stop_when is None:
+                    continue
+                seen = text[-(stop_window + len(delta)):] if stop_window else text
+                if stop_when(seen):
+                    # Output tokens are only final at message_delta, so a cut
+                    # stream's usage undercounts them
+                    self._record(model, stream.current_message_snapshot.usage, text, None)
+                    return text
+            msg = stream.get_final_message()
+        self._record(model, msg.usage, text, key)
+        return text
+
+    def _call_batch(
+        self,
+        model: str,
+        prompts: list[tuple],
+        max_tokens: int = 4096,
+        temperature: float = 0.3,
+    ) -> list[Optional[str]]:
+        """Run (system, user) prompts through the Message Batches API.
+
+        Batched requests cost half as much but complete asynchronously; this
+        blocks, polling every BATCH_POLL_SECONDS. Returns the texts in prompt
+        order, with None for requests that errored or were still pending at
+        BATCH_TIMEOUT (the batch is then canceled).
+        """
+        texts: list[Optional[str]] = [None] * len(prompts)
+        keys = {}
+        requests = []
+        for i, (system, user) in enumerate(prompts):
+            key = self._cache_key(model, system, user, max_tokens, temperature)
+            texts[i] = self._cached_response(key)
+            if texts[i] is not None:
+                continue
+            custom_id = f"req-{i}"
+            keys[custom_id] = (i, key)
+            requests.append({
+                "custom_id": custom_id,
+                "params": {
+                    "model": model,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "system": system,
+                    "messages": [{"role": "user", "content": user}],
+                },
+            })
+        if not requests:
+            return texts
+
+        batches = self.client.messages.batches
+        batch = batches.create(requests=requests)
+        _log(f"    Submitted batch {batch.id} ({len(requests)} requests)")
+        deadline = time.time() + BATCH_TIMEOUT
+        while batch.processing_status != "ended":
+            if time.time() >= deadline:
+                _log(f"    Batch {batch.id} still {batch.processing_status} "
+                     f"after {BATCH_TIMEOUT}s — canceling")
+                batches.cancel(batch.id)
+                return texts
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = batches.retrieve(batch.id)
+
+        for entry in batches.results(batch.id):
+            if entry.result.type != "succeeded" or entry.custom_id not in keys:
+                continue
+            i, key = keys[entry.custom_id]
+            msg = entry.result.message
+            self._record(model, msg.usage, msg.content[0].text, key, discount=BATCH_DISCOUNT)
+            texts[i] = msg.content[0].text
+        return texts
+
+    def _cache_key(
+        self,
+        model: str,
+        system: str | list[dict],
+        user: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> Optional[str]:
+        """Response cache key, or None when this call shouldn't be cached."""
+        if self.cache is None or temperature > LLM_CACHE_MAX_TEMPERATURE:
+            return None
+        return hashlib.sha256(json.dumps(
+            {"m": model, "s": system, "u": user, "t": temperature, "n": max_tokens},
+            sort_keys=True,
+        ).encode()).hexdigest()
+
+    def _cached_response(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        with self._usage_lock:
+            hit = self.cache.get(key)
+            if hit is None:
+                return None
+            self.cache_hits += 1
+            return hit["text"]
+
+    def _record(
+        self,
+        model: str,
+        usage,
+        text: str,
+        key: Optional[str],
+        discount: float = 1.0,
+    ):
+        """Add a response's tokens and cost to the totals and cache its text."""
+        input_tokens = usage.input_tokens
+        output_tokens = usage.output_tokens
+        # input_tokens excludes cached prefix tokens; these are reported
+        # separately (None when the request used no cache_control)
+        cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+        cache_read_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
 
-        return msg.content[0].text
+        # Calculate cost
+        input_cost, output_cost = COST_PER_TOKEN.get(model, COST_PER_TOKEN[SONNET_MODEL])
+        cost = discount * (
+            (input_tokens
+             + cache_write_tokens * CACHE_WRITE_MULTIPLIER
+             + cache_read_tokens * CACHE_READ_MULTIPLIER) * input_cost
+            + output_tokens * output_cost
+        )
+        with self._usage_lock:
+            self.total_input_tokens += input_tokens
+            self.total_output_tokens += output_tokens
+            self.total_cache_write_tokens += cache_write_tokens
+            self.total_cache_read_tokens += cache_read_tokens
+            self.call_count += 1
+            self.total_cost += cost
+            if key is not None:
+                self.cache[key] = {"text": text, "ts": time.time()}
 
     def _call_json(
         self,
         model: str,
-        system: str,
+        system: str | list[dict],
         user: str,
         max_tokens: int = 4096,
         temperature: float = 0.3,
     ) -> dict:
         """Make an API call and parse the JSON response."""
-        text = self._call(model, system, user, max_tokens, temperature)
-        # Extract JSON from response (handle markdown code blocks)
-        text = text.strip()
-        if text.startswith("```"):
-            # Remove ```json and closing ```
-            lines = text.split("\n")
-            start = 1 if lines[0].startswith("```") else 0
-            end = len(lines) - 1 if lines[-1].strip() == "```" else len(lines)
-            text = "\n".join(lines[start:end])
-        # Find JSON object or array
-        json_start = text.find("{")
-        json_arr_start = text.find("[")
-        if json_arr_start >= 0 and (json_start < 0 or json_arr_start < json_start):
-            json_start = json_arr_start
-            json_end = text.rfind("]") + 1
-        else:
-            json_end = text.rfind("}") + 1
-        if json_start >= 0 and json_end > json_start:
-            return json.loads(text[json_start:json_end])
-        raise ValueError(f"No JSON found in response: {text[:200]}")
+        return _parse_json_response(self._call(
+            model, system, user, max_tokens, temperature, cache_if=_is_json_response,
+        ))
 
     def get_cost_summary(self) -> dict:
         return {
             "total_calls": self.call_count,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cache_write_tokens": self.total_cache_write_tokens,
+            "total_cache_read_tokens": self.total_cache_read_tokens,
             "total_cost_usd": round(self.total_cost, 4),
+            "cache_hits": self.cache_hits,
+            "cache_hit_rate": round(
+                self.cache_hits / max(self.cache_hits + self.call_count, 1), 3
+            ),
         }
 
+    def save_cache(self):
+        """Persist the response cache (no-op when caching is disabled)."""
+        if self.cache is None:
+            return
+        with self._usage_lock:
+            _save_llm_cache(self.cache)
+
+
+# One SDK client per API key for the whole process, so every LLMClient (and
+# every Phase 2 thread) shares its connection pool
+_anthropic_clients: dict = {}
+_anthropic_clients_lock = threading.Lock()
+
+
+def _shared_anthropic_client(api_key: str):
+    with _anthropic_clients_lock:
+        client = _anthropic_clients.get(api_key)
+        if client is None:
+            kwargs = {}
+            if HAS_H2 and hasattr(anthropic, "DefaultHttpxClient"):
+                kwargs["http_client"] = anthropic.DefaultHttpxClient(http2=True)
+            client = anthropic.Anthropic(api_key=api_key, **kwargs)
+            _anthropic_clients[api_key] = client
+        return client
+
+
+def _load_llm_cache() -> dict:
+    """Load cached responses younger than LLM_CACHE_TTL; missing or corrupt is empty."""
+    try:
+        with open(LLM_CACHE_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    cutoff = time.time() - LLM_CACHE_TTL
+    return {
+        key: entry for key, entry in data.items()
+        if isinstance(entry, dict) and entry.get("ts", 0) >= cutoff
+    }
+
+
+def _save_llm_cache(cache: dict) -> None:
+    """Write the newest LLM_CACHE_MAX_ENTRIES responses atomically; errors are logged."""
+    newest = sorted(cache.items(), key=lambda kv: kv[1].get("ts", 0))[-LLM_CACHE_MAX_ENTRIES:]
+    try:
+        os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+        tmp = LLM_CACHE_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(dict(newest), f)
+        os.replace(tmp, LLM_CACHE_PATH)
+    except OSError as e:
+        _log(f"  LLM cache write failed: {e}")
+
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_OPEN_RE = re.compile(r"[{\[]")
+
+
+def _parse_json_response(text: str):
+    """Parse the JSON object or array in an LLM response (code fences allowed)."""
+    # Extract JSON from response (handle markdown code blocks)
+    text = text.strip()
+    if text.startswith("```"):
+        # Remove ```json and closing ```
+        lines = text.split("\n")
+        start = 1 if lines[0].startswith("```") else 0
+        end = len(lines) - 1 if lines[-1].strip() == "```" else len(lines)
+        text = "\n".join(lines[start:end])
+    # Parse from the first { or [ that starts a valid JSON value; prose or
+    # stray brackets before or after it are ignored
+    for match in _JSON_OPEN_RE.finditer(text):
+        try:
+            return _JSON_DECODER.raw_decode(text, match.start())[0]
+        except json.JSONDecodeError:
+            continue
+    raise ValueError(f"No JSON found in response: {text[:200]}")
+
+
+def _is_json_response(text: str) -> bool:
+    try:
+        _parse_json_response(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _cached_system(text: str) -> list[dict]:
+    """System prompt as a single block marked for prompt caching.
+
+    Only worth it for prompts that are identical across calls in a run and
+    above the model's minimum cacheable length (1024 tokens for Sonnet);
+    shorter prompts are sent uncached either way.
+    """
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
 
 # =============================================================================
 # HAIKU TASKS (cheap, fast — bulk work)
@@ -219,12 +517,14 @@ def rank_candidates(client: LLMClient, candidates: list[dict]) -> list[dict]:
     _log("  [Haiku] Ranking candidates...")
 
     # Build compact candidate list for the prompt
+    # Whole hours and 60-char headlines are plenty for bulk scoring
     candidate_lines = []
     for i, c in enumerate(candidates):
+        age = c.get("age_hours")
         line = (
             f"{i}: [{c.get('source', '?')}] "
-            f"{c.get('headline', '?')[:80]} "
-            f"(age:{c.get('age_hours', '?')}h, "
+            f"{c.get('headline', '?')[:60]} "
+            f"(age:{'?' if age is None else int(age)}h, "
             f"cat:{c.get('_category', '?')})"
         )
         candidate_lines.append(line)
@@ -315,6 +615,37 @@ def generate_ga_oneliner(client: LLMClient, article: dict) -> dict:
 
     Uses Haiku — these are compact factual summaries.
     """
+    system, user = _ga_oneliner_prompt(article)
+    try:
+        text = client._call(HAIKU_MODEL, system, user, max_tokens=200)
+    except Exception as e:
+        _log(f"    GA oneliner failed for '{article.get('headline', '')[:40]}': {e}")
+        return {"headline": article.get("headline", ""), "context": ""}
+    return _ga_oneliner_result(article, text)
+
+
+def generate_ga_oneliners_batch(client: LLMClient, articles: list[dict]) -> list[Optional[dict]]:
+    """
+    GA one-liners for `articles` via the Message Batches API (half price).
+
+    Blocks until the batch ends. Returns one-liners in article order, with
+    None where the batch produced nothing — callers fall back to
+    generate_ga_oneliner for those.
+    """
+    try:
+        texts = client._call_batch(
+            HAIKU_MODEL, [_ga_oneliner_prompt(a) for a in articles], max_tokens=200
+        )
+    except Exception as e:
+        _log(f"    GA batch failed: {e} — falling back to direct calls")
+        return [None] * len(articles)
+    return [
+        _ga_oneliner_result(article, text) if text is not None else None
+        for article, text in zip(articles, texts)
+    ]
+
+
+def _ga_oneliner_prompt(article: dict) -> tuple[str, str]:
     headline = article.get("headline", "")
     source = article.get("source", "")
     text = article.get("article_text", "")[:1500]
@@ -334,9 +665,14 @@ def generate_ga_oneliner(client: LLMClient, article: dict) -> dict:
         f"Source: {source}\n\n"
         f"Article excerpt:\n{text[:800]}"
     )
+    return system, user
+
 
+def _ga_oneliner_result(article: dict, text: str) -> dict:
+    """Parse a GA one-liner response, falling back to the original headline."""
+    headline = article.get("headline", "")
     try:
-        result = client._call_json(HAIKU_MODEL, system, user, max_tokens=200)
+        result = _parse_json_response(text)
         ga_headline = result.get("headline", headline)
         ga_context = result.get("context", "")
         # Quality gate: if headline is meta-commentary, use original
@@ -397,6 +733,9 @@ _LLM_REFUSAL_PATTERNS = [
     "rewritten headline:",
     "note:",
 ]
+# Longest pattern: a refusal completed by a new delta starts within this
+# many characters before it
+_LLM_REFUSAL_WINDOW = max(map(len, _LLM_REFUSAL_PATTERNS))
 
 
 def _is_llm_refusal(text: str) -> bool:
@@ -473,6 +812,75 @@ def rewrite_headline(client: LLMClient, article: dict) -> str:
         return headline
 
 
+def rewrite_and_summarize(client: LLMClient, article: dict) -> tuple[str, str]:
+    """
+    Rewrite the headline and summarize a Tier 1 article in one call.
+
+    Uses Haiku — combines rewrite_headline and summarize_article so the
+    article text is sent once. Returns (headline, summary) with the same
+    fallbacks as the separate calls. A reply that isn't the requested JSON
+    (typically a prose refusal) comes back as the summary, so the caller's
+    refusal gate still sees it.
+    """
+    headline = article.get("headline", "")
+    source = article.get("source", "")
+    text = article.get("article_text", "")[:3000]
+
+    if not text:
+        return headline, f"{headline} ({source}). [Article text not available for summarization.]"
+
+    system = (
+        "You are a news editor for a busy executive. Do two things:\n"
+        "1. headline: rewrite the headline to be more specific and informative. "
+        "Include key details (company names, numbers, actions). Max 15 words. "
+        "Headline text only — no commentary, no quotes around it.\n"
+        "2. summary: write a 2-3 sentence summary of the actual news — what happened, "
+        "key numbers, and who's involved. Be factual and specific. "
+        "Do NOT include opinions, implications, or 'So What' analysis. "
+        "Do NOT introduce statistics or quotes not present in the text.\n"
+        'Return JSON: {"headline": "...", "summary": "..."}'
+    )
+
+    user = (
+        f"Headline: {headline}\n"
+        f"Source: {source}\n\n"
+        f"Article text:\n{text}"
+    )
+
+    try:
+        reply = client._call(
+            HAIKU_MODEL, system, user, max_tokens=400, cache_if=_is_summary_json,
+        )
+    except Exception as e:
+        _log(f"    Summary failed for '{headline[:40]}': {e}")
+        return headline, f"{headline}. ({source})"
+
+    try:
+        result = _parse_json_response(reply)
+    except ValueError:
+        result = None
+    if not isinstance(result, dict):
+        _log(f"    Summary reply for '{headline[:40]}' is not JSON — passing it through")
+        return headline, reply.strip()
+
+    new_headline = str(result.get("headline") or "").strip().strip('"').strip("'")
+    # Quality gate: if LLM produced meta-commentary instead of a headline, use original
+    if not new_headline or _is_llm_refusal(new_headline) or len(new_headline) > 120:
+        _log(f"    Headline rewrite unusable, using original: {headline[:50]}")
+        new_headline = headline
+    summary = str(result.get("summary") or "").strip()
+    if not summary:
+        summary = f"{headline}. ({source})"
+    return new_headline, summary
+
+
+def _is_summary_json(text: str) -> bool:
+    try:
+        return isinstance(_parse_json_response(text), dict)
+    except ValueError:
+        return False
+
+
 # =============================================================================
 # SONNET TASKS (quality-critical)
 # =============================================================================
@@ -489,7 +897,7 @@ def generate_so_what(client: LLMClient, article: dict, summary: str) -> str:
     text = article.get("article_text", "")[:3000]
     category = article.get("_category", "general")
 
-    system = (
+    system = _cached_system(
         "You are writing the 'So What' section for a premium executive newsletter. "
         "This is the most valuable part of each story — it translates news into "
         "strategic implications for the reader.\n\n"
@@ -519,7 +927,14 @@ def generate_so_what(client: LLMClient, article: dict, summary: str) -> str:
     )
 
     try:
-        return client._call(SONNET_MODEL, system, user, max_tokens=400, temperature=0.4)
+        # Streamed so a refusal stops generation as soon as it shows up; the
+        # story is dropped for it either way. A stopped stream's usage comes
+        # from the partial message, so its output tokens (and the cost in
+        # get_cost_summary) are undercounted
+        return client._call_stream(
+            SONNET_MODEL, system, user, max_tokens=400, temperature=0.4,
+            stop_when=_is_llm_refusal, stop_window=_LLM_REFUSAL_WINDOW,
+        )
     except Exception as e:
         _log(f"    So What failed for '{headline[:40]}': {e}")
         return "[So What generation failed — review manually]"
@@ -611,7 +1026,7 @@ def quality_review(client: LLMClient, briefing: dict) -> dict:
 
 
 # =============================================================================
-# ORCHESTRATOR — runs all LLM tasks in sequence
+# ORCHESTRATOR — runs all LLM tasks; independent per-item calls fan out
 # =============================================================================
 
 def run_phase2_llm(
@@ -622,6 +1037,7 @@ def run_phase2_llm(
     briefing_date: str = "",
     api_key: str = None,
     backfill_candidates: list[dict] = None,
+    batch_ga: bool = False,
 ) -> dict:
     """
     Run all Phase 2 LLM tasks and return structured JSON for template rendering.
@@ -637,6 +1053,8 @@ def run_phase2_llm(
         api_key: Anthropic API key (or from env)
         backfill_candidates: Additional scored candidates to try if Tier 1
             stories are rejected during summarization (content mismatch, etc.)
+        batch_ga: Generate GA one-liners through the Message Batches API
+            (half price, but can take minutes) instead of direct calls.
 
     Returns:
         Structured dict ready for Jinja2 template rendering.
@@ -652,8 +1070,39 @@ def run_phase2_llm(
     _log("=" * 60)
 
     client = LLMClient(api_key=api_key)
+    # Per-item calls within a step are independent, so each step fans them
+    # out here; pool.map hands results back in input order
+    pool = ThreadPoolExecutor(max_workers=LLM_CONCURRENCY, thread_name_prefix="mb-llm")
+    try:
+        return _run_phase2_steps(
+            client, pool, tier1_articles, ga_articles, noteworthy_x_posts,
+            local_articles, briefing_date, backfill_candidates, batch_ga,
+        )
+    finally:
+        pool.shutdown()
+        client.save_cache()
+
 
-    # ---- Step 1: Tier 1 — summaries + headlines (Haiku, parallel-ready) ----
+def _run_phase2_steps(
+    client: LLMClient,
+    pool: ThreadPoolExecutor,
+    tier1_articles: list[dict],
+    ga_articles: list[dict],
+    noteworthy_x_posts: list[dict],
+    local_articles: list[dict],
+    briefing_date: str,
+    backfill_candidates: list[dict],
+    batch_ga: bool,
+) -> dict:
+    """Body of run_phase2_llm, with per-item calls on `pool`."""
+    # GA one-liners don't depend on Tier 1, so a batch is submitted up front
+    # and processed while Steps 1-2 run
+    ga_batch = ga_articles[:10]
+    ga_batch_future = None
+    if batch_ga and ga_batch:
+        ga_batch_future = pool.submit(generate_ga_oneliners_batch, client, ga_batch)
+
+    # ---- Step 1: Tier 1 — summaries + headlines (Haiku, concurrent) ----
     _log("\n[1/5] Generating Tier 1 summaries (Haiku)...")
     tier1_stories = []
     TIER1_TARGET = 6
@@ -662,8 +1111,7 @@ def run_phase2_llm(
     def _try_summarize(article: dict, story_num: int) -> dict | None:
         """Attempt to summarize an article. Returns story dict or None if rejected."""
         _log(f"  Story {story_num}: {article.get('headline', '?')[:50]}...")
-        new_headline = rewrite_headline(client, article)
-        summary = summarize_article(client, article)
+        new_headline, summary = rewrite_and_summarize(client, article)
         if _is_llm_refusal(summary):
             _log(f"    REJECT story {story_num}: summary indicates content mismatch — skipping")
             return None
@@ -683,36 +1131,40 @@ def run_phase2_llm(
             "_category": article.get("_category", "general"),
         }
 
+    def _summarize_all(articles: list[dict], first_num: int) -> None:
+        """Summarize `articles` concurrently, keeping the accepted ones in order."""
+        results = pool.map(_try_summarize, articles,
+                           range(first_num, first_num + len(articles)))
+        tier1_stories.extend(r for r in results if r)
+
     # Process initial Tier 1 candidates
-    story_num = 0
-    for article in tier1_articles[:TIER1_TARGET]:
-        story_num += 1
-        result = _try_summarize(article, story_num)
-        if result:
-            tier1_stories.append(result)
-        time.sleep(0.2)
-
-    # Backfill: if we have fewer than target, try additional candidates
+    initial = tier1_articles[:TIER1_TARGET]
+    _summarize_all(initial, 1)
+    story_num = len(initial)
+
+    # Backfill: if we have fewer than target, try additional candidates. Each
+    # wave is only as large as the shortfall, so exactly the candidates a
+    # one-at-a-time walk would try get tried, in the same order
     backfill_idx = 0
     while len(tier1_stories) < TIER1_TARGET and backfill_idx < len(backfill_candidates):
-        candidate = backfill_candidates[backfill_idx]
-        backfill_idx += 1
-        if candidate.get("url") in tried_urls:
-            continue
-        tried_urls.add(candidate.get("url"))
-        story_num += 1
-        _log(f"  [Backfill] Trying: {candidate.get('headline', '?')[:50]}...")
-        result = _try_summarize(candidate, story_num)
-        if result:
-            tier1_stories.append(result)
-        time.sleep(0.2)
+        wave = []
+        while (len(wave) < TIER1_TARGET - len(tier1_stories)
+               and backfill_idx < len(backfill_candidates)):
+            candidate = backfill_candidates[backfill_idx]
+            backfill_idx += 1
+            if candidate.get("url") in tried_urls:
+                continue
+            tried_urls.add(candidate.get("url"))
+            _log(f"  [Backfill] Trying: {candidate.get('headline', '?')[:50]}...")
+            wave.append(candidate)
+        _summarize_all(wave, story_num + 1)
+        story_num += len(wave)
 
     # ---- Step 2: So Whats (Sonnet — quality-critical) ----
     _log("\n[2/7] Generating So Whats (Sonnet)...")
-    stories_to_remove = []
-    for story in tier1_stories:
-        _log(f"  So What for: {story['headline'][:50]}...")
-        so_what = generate_so_what(
+
+    def _so_what_for(story: dict) -> str:
+        return generate_so_what(
             client,
             {
                 "headline": story["headline"],
@@ -723,28 +1175,33 @@ def run_phase2_llm(
             story["summary"],
         )
 
-        # Quality gate: if So What failed, retry once
-        if so_what.startswith("[So What generation failed"):
-            _log(f"    Retrying So What for: {story['headline'][:50]}...")
-            time.sleep(1)
-            so_what = generate_so_what(
-                client,
-                {
-                    "headline": story["headline"],
-                    "source": story["source"],
-                    "article_text": story.get("article_text", ""),
-                    "_category": story.get("_category", "general"),
-                },
-                story["summary"],
-            )
+    for story in tier1_stories:
+        _log(f"  So What for: {story['headline'][:50]}...")
+    # The first call writes the cached system prompt; fanning out only after
+    # it returns lets the remaining calls read it instead of each writing it
+    so_whats = [_so_what_for(story) for story in tier1_stories[:1]]
+    so_whats.extend(pool.map(_so_what_for, tier1_stories[1:]))
+
+    # Quality gate: retry failed So Whats once, as a single wave after one
+    # shared pause rather than a sleep per story
+    failed = [i for i, so_what in enumerate(so_whats)
+              if so_what.startswith("[So What generation failed")]
+    if failed:
+        for i in failed:
+            _log(f"    Retrying So What for: {tier1_stories[i]['headline'][:50]}...")
+        time.sleep(1)
+        retried = pool.map(_so_what_for, [tier1_stories[i] for i in failed])
+        for i, so_what in zip(failed, retried):
+            so_whats[i] = so_what
 
+    stories_to_remove = []
+    for story, so_what in zip(tier1_stories, so_whats):
         # If still failed or is a refusal, mark for removal
         if so_what.startswith("[So What generation failed") or _is_llm_refusal(so_what):
             _log(f"    DROPPING story: So What unusable after retry — {story['headline'][:50]}")
             stories_to_remove.append(story)
         else:
             story["so_what"] = so_what
-        time.sleep(0.3)
 
     # Remove stories with failed So Whats
     for story in stories_to_remove:
@@ -762,8 +1219,12 @@ def run_phase2_llm(
     # ---- Step 3: GA one-liners (Haiku) ----
     _log("\n[3/5] Generating GA one-liners (Haiku)...")
     ga_items = []
-    for article in ga_articles[:10]:
-        oneliner = generate_ga_oneliner(client, article)
+    oneliners = ga_batch_future.result() if ga_batch_future else [None] * len(ga_batch)
+    missing = [i for i, oneliner in enumerate(oneliners) if oneliner is None]
+    direct = pool.map(lambda i: generate_ga_oneliner(client, ga_batch[i]), missing)
+    for i, oneliner in zip(missing, direct):
+        oneliners[i] = oneliner
+    for article, oneliner in zip(ga_batch, oneliners):
         ga_items.append({
             "flag": article.get("_flag", "🇺🇸"),
             "headline": oneliner["headline"],
@@ -774,14 +1235,14 @@ def run_phase2_llm(
             "read_time_min": article.get("estimated_read_time_min", 3),
             "has_paywall": article.get("has_paywall", False),
         })
-        time.sleep(0.2)
     _log(f"    Generated {len(ga_items)} GA items")
 
     # ---- Step 4: Noteworthy X post summaries (Haiku) ----
     _log("\n[4/7] Generating Noteworthy X summaries (Haiku)...")
     x_post_items = []
-    for post in noteworthy_x_posts[:4]:
-        summary = summarize_x_post(client, post)
+    x_batch = noteworthy_x_posts[:4]
+    x_summaries = pool.map(lambda post: summarize_x_post(client, post), x_batch)
+    for post, summary in zip(x_batch, x_summaries):
         if summary is None:
             continue  # Skip posts where summary was unusable
         x_post_items.append({
@@ -791,7 +1252,6 @@ def run_phase2_llm(
             "age_hours": post.get("age_hours"),
             "post_time": post.get("post_time", ""),
         })
-        time.sleep(0.2)
     _log(f"    Generated {len(x_post_items)} X post summaries")
 
     # ---- Step 5: Today in 30 Seconds (Sonnet) ----
@@ -876,6 +1336,9 @@ def run_phase2_llm(
     _log(f"  LLM calls:    {cost['total_calls']}")
     _log(f"  Input tokens:  {cost['total_input_tokens']:,}")
     _log(f"  Output tokens: {cost['total_output_tokens']:,}")
+    _log(f"  Cached input:  {cost['total_cache_read_tokens']:,} read / "
+         f"{cost['total_cache_write_tokens']:,} written")
+    _log(f"  Replayed:      {cost['cache_hits']} responses from cache")
     _log(f"  Total cost:    ${cost['total_cost_usd']:.4f}")
 
     return output
@@ -15,18 +15,56 @@ Also provides:
 import json
 import re
 import sys
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from urllib.parse import urlparse
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from dateutil import parser as date_parser
 
+# Optional: lxml as BeautifulSoup's tree builder (C parser, much faster than
+# the pure-Python "html.parser" on full article pages)
+try:
+    import lxml  # noqa: F401
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+SOUP_PARSER = "lxml" if HAS_LXML else "html.parser"
+
+# Optional: orjson for faster JSON decoding (JSON-LD, on-disk caches)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def json_loads(text):
+    """json.loads, via orjson when installed. Input orjson is stricter about
+    (NaN literals, lone surrogate escapes) still decodes via the stdlib."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 # Configuration
 MAX_AGE_HOURS = 48
 REQUEST_TIMEOUT = 15
+# Article downloads stop after this many bytes. Dates and titles sit in
+# <head>; the cap is sized to also keep the opening of the article body
+# that article-text extraction (5000 chars) and the read-time estimate use.
+MAX_HTML_BYTES = 512 * 1024
+# Only entry title/link/published are read from feeds, so feedparser's HTML
+# sanitizer and relative-URI rewriting of entry content are wasted work
+# (links are still resolved against xml:base). Roughly halves parse time.
+FEED_PARSE_OPTIONS = {"sanitize_html": False, "resolve_relative_uris": False}
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 
@@ -129,12 +167,19 @@ DOMAIN_TO_SOURCE = {
 }
 
 
+# Any DOMAIN_TO_SOURCE fragment, so URLs matching none (the usual case) are
+# ruled out in one scan before the ordered per-fragment check
+_DOMAIN_FRAGMENT_RE = re.compile("|".join(map(re.escape, DOMAIN_TO_SOURCE)))
+
+_PAREN_SUFFIX_RE = re.compile(r"\s*\([^)]*\)\s*$")
+
+
 def _normalize_source_name(name: str) -> str:
     """Normalize a source name for tier lookup.
     Strips parenthetical suffixes like '(AFP)', whitespace, and 'The' prefix.
     """
     # Remove parenthetical suffixes: "Times of Israel (AFP)" -> "Times of Israel"
-    name = re.sub(r"\s*\([^)]*\)\s*$", "", name)
+    name = _PAREN_SUFFIX_RE.sub("", name)
     return name.strip().lower()
 
 
@@ -152,10 +197,12 @@ def classify_source_tier(source_name: str, url: str = "") -> dict:
 
     # Check URL domain for additional classification
     url_lower = url.lower() if url else ""
-    for domain_frag, mapped_source in DOMAIN_TO_SOURCE.items():
-        if domain_frag in url_lower:
-            name_lower = mapped_source.lower()
-            break
+    if url_lower and _DOMAIN_FRAGMENT_RE.search(url_lower):
+        # First fragment in dict order wins, as before
+        for domain_frag, mapped_source in DOMAIN_TO_SOURCE.items():
+            if domain_frag in url_lower:
+                name_lower = mapped_source.lower()
+                break
 
     # Check each tier (try both normalized and original)
     names_to_check = {name_lower}
@@ -343,21 +390,28 @@ def validate_status_id_delta(candidate_id: int, reference_id: int) -> dict:
     }
 
 
+_STATUS_ID_RE = re.compile(r"(?:x\.com|twitter\.com)/\w+/status/(\d+)")
+
+
 def extract_status_id_from_url(url: str) -> Optional[int]:
     """Extract the numeric status ID from an x.com/twitter.com URL."""
-    match = re.search(r"(?:x\.com|twitter\.com)/\w+/status/(\d+)", url)
+    match = _STATUS_ID_RE.search(url)
     if match:
         return int(match.group(1))
     return None
 
 
-def compute_age_hours(verified_date: str, delivery_time: datetime) -> Optional[int]:
+def compute_age_hours(verified_date: str | datetime, delivery_time: datetime) -> Optional[int]:
     """
     Compute age in hours between a verified date and the delivery time.
+    Accepts a date string or an already-parsed datetime.
     Returns integer hours or None if date can't be parsed.
     """
     try:
-        pub_date = date_parser.parse(verified_date)
+        if isinstance(verified_date, datetime):
+            pub_date = verified_date
+        else:
+            pub_date = _parse_date(verified_date)
         if pub_date.tzinfo is None:
             pub_date = pub_date.replace(tzinfo=timezone.utc)
         if delivery_time.tzinfo is None:
@@ -415,9 +469,43 @@ SEARCH_QUERIES = [
 ]
 
 
+# Connection pool sizing: one pool per host (RSS feeds + article sites) and
+# enough keep-alive sockets per host for the concurrent fetch workers. A run
+# touches 100+ hosts with fetches interleaved across them, so keep enough
+# host pools that a warm connection isn't evicted before its host comes
+# round again
+POOL_CONNECTIONS = 128
+POOL_MAXSIZE = 50
+
+# Transient failures (refused connects, 5xx from overloaded hosts) get a
+# couple of quick retries on the same pooled connection instead of dropping
+# the article. Read errors are not retried: the request reached a host that
+# is too slow to answer, and re-sending it holds that host's slot for
+# another full timeout. 429 is not retried either, since honoring
+# Retry-After would stall a worker and ignoring it re-hits a host that asked
+# us to back off.
+RETRY_TOTAL = 2
+RETRY_READ = 0
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (502, 503, 504)
+
+
 def get_session() -> requests.Session:
-    """Create a requests session with proper headers."""
+    """Create a requests session with proper headers, a sized connection pool
+    and retries for transient errors."""
     session = requests.Session()
+    retry = Retry(
+        total=RETRY_TOTAL,
+        read=RETRY_READ,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=False,
+        raise_on_status=False,  # hand back the last response, as before
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE,
+                          max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
     session.headers.update({
         "User-Agent": USER_AGENT,
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -426,57 +514,82 @@ def get_session() -> requests.Session:
     return session
 
 
-def extract_date_from_meta(soup: BeautifulSoup) -> Optional[datetime]:
-    """Extract date from meta tags."""
-    # Try article:published_time (Open Graph)
-    meta = soup.find("meta", property="article:published_time")
-    if meta and meta.get("content"):
-        try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
+def read_capped_body(resp: requests.Response, limit: int = MAX_HTML_BYTES,
+                      deadline: Optional[float] = None) -> tuple[bytes, bool]:
+    """Stream up to `limit` bytes of a response body without downloading the
+    rest of the page. Returns (body, complete).
 
-    # Try og:published_time
-    meta = soup.find("meta", property="og:published_time")
-    if meta and meta.get("content"):
-        try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
+    With a `deadline` (time.monotonic() value), reading also stops once it
+    passes and whatever arrived is used: requests' timeout only bounds each
+    socket read, so a server trickling bytes could otherwise hold a fetch
+    thread far longer than REQUEST_TIMEOUT. `complete` is False only then.
+    """
+    body = bytearray()
+    for chunk in resp.iter_content(chunk_size=16384):
+        body += chunk
+        if len(body) >= limit:
+            del body[limit:]
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            return bytes(body), False
+    return bytes(body), True
 
-    # Try pubdate
-    meta = soup.find("meta", attrs={"name": "pubdate"})
-    if meta and meta.get("content"):
-        try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
 
-    # Try date
-    meta = soup.find("meta", attrs={"name": "date"})
-    if meta and meta.get("content"):
-        try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
+def decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """Decode a page body the way resp.text would with `encoding`."""
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except LookupError:
+        # Unknown charset named in the headers
+        return str(body, "utf-8", errors="replace")
 
-    # Try DC.date
-    meta = soup.find("meta", attrs={"name": "DC.date"})
-    if meta and meta.get("content"):
-        try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
 
-    # Try sailthru.date
-    meta = soup.find("meta", attrs={"name": "sailthru.date"})
-    if meta and meta.get("content"):
+# Plain ISO 8601 as sites write it in meta/JSON-LD/<time>: "2026-02-10",
+# "2026-02-10T14:30:00Z", "2026-02-10 14:30:00.123+05:30". For these
+# datetime.fromisoformat (C) gives the same result as dateutil.
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}"
+    r"(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?(?:Z|[+-]\d{2}:\d{2})?)?"
+)
+
+
+def _parse_date(text: str) -> datetime:
+    """dateutil's parse, with a fast path for plain ISO 8601 strings."""
+    if isinstance(text, str) and _ISO_DATETIME_RE.fullmatch(text):
         try:
-            return date_parser.parse(meta["content"])
-        except:
-            pass
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass  # out-of-range field; let dateutil have its say
+    return date_parser.parse(text)
 
-    return None
+
+# (attribute, value) pairs identifying date meta tags, most reliable first
+_DATE_META_TAGS = (
+    ("property", "article:published_time"),  # Open Graph
+    ("property", "og:published_time"),
+    ("name", "pubdate"),
+    ("name", "date"),
+    ("name", "DC.date"),
+    ("name", "sailthru.date"),
+)
+
+
+def extract_date_from_meta(soup: BeautifulSoup) -> Optional[datetime]:
+    """Extract date from meta tags."""
+    return _extract_date_from_meta_tag(soup)[0]
+
+
+def _extract_date_from_meta_tag(soup: BeautifulSoup) -> tuple[Optional[datetime], Optional[str]]:
+    """Extract date from meta tags, along with the tag value that supplied it."""
+    for attr, value in _DATE_META_TAGS:
+        meta = soup.find("meta", attrs={attr: value})
+        if meta and meta.get("content"):
+            try:
+                return _parse_date(meta["content"]), value
+            except:
+                pass
+
+    return None, None
 
 
 def extract_date_from_jsonld(soup: BeautifulSoup) -> Optional[datetime]:
@@ -484,26 +597,26 @@ def extract_date_from_jsonld(soup: BeautifulSoup) -> Optional[datetime]:
     scripts = soup.find_all("script", type="application/ld+json")
     for script in scripts:
         try:
-            data = json.loads(script.string)
+            data = json_loads(script.string)
             # Handle array of objects
             if isinstance(data, list):
                 for item in data:
                     if isinstance(item, dict):
                         date_str = item.get("datePublished") or item.get("dateCreated")
                         if date_str:
-                            return date_parser.parse(date_str)
+                            return _parse_date(date_str)
             # Handle single object
             elif isinstance(data, dict):
                 date_str = data.get("datePublished") or data.get("dateCreated")
                 if date_str:
-                    return date_parser.parse(date_str)
+                    return _parse_date(date_str)
                 # Check nested @graph
                 if "@graph" in data:
                     for item in data["@graph"]:
                         if isinstance(item, dict):
                             date_str = item.get("datePublished") or item.get("dateCreated")
                             if date_str:
-                                return date_parser.parse(date_str)
+                                return _parse_date(date_str)
         except:
             continue
     return None
@@ -515,7 +628,7 @@ def extract_date_from_time_tag(soup: BeautifulSoup) -> Optional[datetime]:
     time_tags = soup.find_all("time", datetime=True)
     for tag in time_tags:
         try:
-            return date_parser.parse(tag["datetime"])
+            return _parse_date(tag["datetime"])
         except:
             continue
 
@@ -524,26 +637,29 @@ def extract_date_from_time_tag(soup: BeautifulSoup) -> Optional[datetime]:
     for tag in time_tags:
         try:
             if tag.get("datetime"):
-                return date_parser.parse(tag["datetime"])
+                return _parse_date(tag["datetime"])
             elif tag.string:
-                return date_parser.parse(tag.string)
+                return _parse_date(tag.string)
         except:
             continue
 
     return None
 
 
-def extract_date_from_visible_text(soup: BeautifulSoup) -> Optional[datetime]:
-    """Extract date from visible text patterns (last resort)."""
-    # Common date container classes
-    date_classes = [
+# Common date container classes (compiled once; matched case-insensitively)
+_DATE_CLASS_RES = [
+    re.compile(class_name, re.I) for class_name in (
         "date", "published", "post-date", "article-date", "timestamp",
         "byline-date", "publish-date", "entry-date", "meta-date",
-        "article__date", "article-meta", "post-meta"
-    ]
+        "article__date", "article-meta", "post-meta",
+    )
+]
+
 
-    for class_name in date_classes:
-        elements = soup.find_all(class_=re.compile(class_name, re.I))
+def extract_date_from_visible_text(soup: BeautifulSoup) -> Optional[datetime]:
+    """Extract date from visible text patterns (last resort)."""
+    for class_re in _DATE_CLASS_RES:
+        elements = soup.find_all(class_=class_re)
         for el in elements:
             text = el.get_text(strip=True)
             try:
@@ -558,46 +674,70 @@ def extract_date_from_visible_text(soup: BeautifulSoup) -> Optional[datetime]:
     return None
 
 
-def extract_publication_date(html: str, url: str) -> Optional[datetime]:
+def extract_publication_date(html: str, url: str, soup: Optional[BeautifulSoup] = None) -> Optional[datetime]:
     """
     Extract publication date from HTML using multiple strategies.
     Returns None if date cannot be determined.
+    Pass `soup` to reuse a tree the caller has already parsed.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return extract_publication_date_with_method(html, url, soup=soup)[0]
+
 
-    # Try strategies in order of reliability
+def extract_publication_date_with_method(
+    html: str, url: str, soup: Optional[BeautifulSoup] = None,
+) -> tuple[Optional[datetime], Optional[str]]:
+    """
+    Like extract_publication_date, but also returns the name of the strategy
+    that produced the date. Returns (None, None) if no strategy succeeds.
+    """
+    if soup is None:
+        soup = BeautifulSoup(html, SOUP_PARSER)
+
+    # Meta tags are the most reliable; the label names the tag that matched
+    try:
+        date, tag = _extract_date_from_meta_tag(soup)
+        if date:
+            return _as_aware(date), f"meta {tag}"
+    except Exception:
+        pass
+
+    # Then the remaining strategies in order of reliability
     strategies = [
-        ("meta tags", extract_date_from_meta),
-        ("JSON-LD", extract_date_from_jsonld),
-        ("time tags", extract_date_from_time_tag),
-        ("visible text", extract_date_from_visible_text),
+        ("JSON-LD datePublished", extract_date_from_jsonld),
+        ("time tag", extract_date_from_time_tag),
+        ("visible text / heuristic", extract_date_from_visible_text),
     ]
 
     for strategy_name, strategy_func in strategies:
         try:
             date = strategy_func(soup)
             if date:
-                # Ensure timezone awareness for comparison
-                if date.tzinfo is None:
-                    date = date.replace(tzinfo=timezone.utc)
-                return date
+                return _as_aware(date), strategy_name
         except Exception as e:
             continue
 
-    return None
+    return None, None
+
 
+def _as_aware(date: datetime) -> datetime:
+    """Ensure timezone awareness for comparison (naive dates are taken as UTC)."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
 
-def estimate_read_time(html: str) -> int:
-    """Estimate reading time in minutes based on word count."""
-    soup = BeautifulSoup(html, "html.parser")
+
+def estimate_read_time(html: str, soup: Optional[BeautifulSoup] = None) -> int:
+    """Estimate reading time in minutes based on word count.
+    A caller-supplied `soup` has its script/nav/etc. tags removed in place."""
+    if soup is None:
+        soup = BeautifulSoup(html, SOUP_PARSER)
 
     # Remove script, style, nav elements
     for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
         tag.decompose()
 
-    # Get text content
-    text = soup.get_text(separator=" ", strip=True)
-    word_count = len(text.split())
+    # Count words string by string rather than joining the whole page first
+    word_count = sum(len(text.split()) for text in soup.stripped_strings)
 
     # ~250 words per minute
     read_time = max(1, round(word_count / 250))
@@ -638,16 +778,21 @@ def fetch_and_validate_article(session: requests.Session, url: str, source: str,
     Returns validated article dict or None if invalid/stale.
     """
     try:
-        response = session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
-        response.raise_for_status()
-        html = response.text
+        with session.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True,
+                         stream=True) as response:
+            response.raise_for_status()
+            body, _ = read_capped_body(response)
+            html = decode_body(body, response.encoding)
+
+        # Parse once and share the tree; estimate_read_time strips tags
+        # from it, so it runs last
+        soup = BeautifulSoup(html, SOUP_PARSER)
 
         # Extract publication date
-        pub_date = extract_publication_date(html, url)
+        pub_date = extract_publication_date(html, url, soup=soup)
 
         # Extract headline from page if not provided
         if not headline:
-            soup = BeautifulSoup(html, "html.parser")
             h1 = soup.find("h1")
             if h1:
                 headline = h1.get_text(strip=True)
@@ -660,7 +805,7 @@ def fetch_and_validate_article(session: requests.Session, url: str, source: str,
                     headline = title.get_text(strip=True) if title else "Unknown"
 
         # Estimate read time
-        read_time = estimate_read_time(html)
+        read_time = estimate_read_time(html, soup=soup)
 
         # Build result
         result = {
@@ -716,7 +861,15 @@ def fetch_rss_candidates(session: requests.Session) -> list[dict]:
     for source_name, feed_url in RSS_FEEDS.items():
         try:
             print(f"  Fetching RSS: {source_name}...", file=sys.stderr)
-            feed = feedparser.parse(feed_url)
+            # Over the shared session's keep-alive pool rather than letting
+            # feedparser open its own urllib connection per feed
+            resp = session.get(feed_url, timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
+            feed = feedparser.parse(
+                resp.content,
+                response_headers={"content-type": resp.headers.get("content-type", "")},
+                **FEED_PARSE_OPTIONS,
+            )
 
             for entry in feed.entries[:10]:  # Limit per feed
                 url = entry.get("link", "")
@@ -738,16 +891,51 @@ def fetch_rss_candidates(session: requests.Session) -> list[dict]:
     return candidates
 
 
+# Punctuation and whitespace runs, collapsed when comparing headlines
+_HEADLINE_NOISE_RE = re.compile(r"[\W_]+")
+
+
+def _headline_key(candidate: dict) -> Optional[tuple]:
+    """Key identifying one story from one source: normalized headline and
+    source, plus is_local so a local-search copy isn't folded into a general one."""
+    headline = _HEADLINE_NOISE_RE.sub(" ", candidate.get("headline", "").lower()).strip()
+    if not headline:
+        return None
+    source = _normalize_source_name(candidate.get("source", ""))
+    return headline, source, bool(candidate.get("is_local"))
+
+
+def _normalize_url(url: str) -> str:
+    """Dedup key for a URL: no query string or fragment, no trailing slash,
+    scheme and host lowercased (paths are case-sensitive, so kept as is)."""
+    base = url.partition("?")[0].partition("#")[0].rstrip("/")
+    scheme, sep, rest = base.partition("://")
+    if not sep:
+        return base
+    host, slash, path = rest.partition("/")
+    return f"{scheme.lower()}://{host.lower()}{slash}{path}"
+
+
 def deduplicate_candidates(candidates: list[dict]) -> list[dict]:
-    """Remove duplicate URLs."""
+    """Remove duplicate URLs, and repeats of the same headline from the same
+    source under another URL (AMP/canonical variants, tracking links,
+    a feed item that search also found) so each story is fetched once."""
     seen_urls = set()
+    seen_add = seen_urls.add
+    seen_headlines = set()
     unique = []
 
     for candidate in candidates:
-        url = candidate.get("url", "").split("?")[0].rstrip("/")  # Normalize URL
-        if url and url not in seen_urls:
-            seen_urls.add(url)
-            unique.append(candidate)
+        url = _normalize_url(candidate.get("url", ""))
+        if not url or url in seen_urls:
+            continue
+        seen_add(url)
+        key = _headline_key(candidate)
+        if key is not None:
+            if key in seen_headlines:
+                continue
+            seen_headlines.add(key)
+        unique.append(candidate)
 
     return unique
 
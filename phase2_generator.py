@@ -16,6 +16,7 @@ CRITICAL: This script uses verified_date_display from Phase 1. It NEVER generate
 
 import json
 import os
+import re
 import sys
 from datetime import datetime, timezone
 from typing import Optional
@@ -204,6 +205,13 @@ COUNTRY_FLAGS = {
     "estonia": "🇪🇪", "estonian": "🇪🇪",
 }
 
+# Whole-word pattern per flag keyword, compiled once (in COUNTRY_FLAGS order,
+# which sets precedence)
+_COUNTRY_FLAG_PATTERNS = [
+    (re.compile(r'\b' + re.escape(keyword) + r'\b'), flag)
+    for keyword, flag in COUNTRY_FLAGS.items()
+]
+
 
 # Press release / vendor marketing signals — if 2+ match, penalize heavily
 _PRESS_RELEASE_SIGNALS = [
@@ -291,11 +299,10 @@ def detect_country_flag(text: str) -> str:
     Uses word-boundary matching for all keywords to avoid false matches
     like 'oman' in 'woman', 'un' in 'Runway', or 'eu' in 'neural'.
     """
-    import re
     text_lower = text.lower()
 
-    for keyword, flag in COUNTRY_FLAGS.items():
-        if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower):
+    for pattern, flag in _COUNTRY_FLAG_PATTERNS:
+        if pattern.search(text_lower):
             return flag
 
     # Default to US if no match (most common for business news)
@@ -25,10 +25,18 @@ import os
 import re
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from dotenv import load_dotenv
 load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
 
+# Optional: orjson for faster JSON output
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from data_collector import DataCollector, build_healthcare_log, _log
 from phase1_validator import (
     MAX_AGE_HOURS,
@@ -185,13 +193,19 @@ _ENTITY_NAMES = {
 }
 
 
-def _normalize_words(headline: str) -> set[str]:
+_WORD_RE = re.compile(r'[a-z0-9]+')
+_SPANISH_WORD_RE = re.compile(r'[a-záéíóúñü]+')
+
+
+@lru_cache(maxsize=4096)
+def _normalize_words(headline: str) -> frozenset[str]:
     """Extract significant words from a headline for comparison.
 
     Applies: lowercasing, stop word removal, simple plural stripping,
-    and brand alias normalization.
+    and brand alias normalization. Memoized (the pairwise dedup passes
+    see each headline many times), hence the immutable result.
     """
-    words = re.findall(r'[a-z0-9]+', headline.lower())
+    words = _WORD_RE.findall(headline.lower())
     normalized = set()
     for w in words:
         if w in _STOP_WORDS or len(w) <= 2:
@@ -214,12 +228,12 @@ def _normalize_words(headline: str) -> set[str]:
         # Brand alias normalization
         w = _BRAND_ALIASES.get(w, w)
         normalized.add(w)
-    return normalized
+    return frozenset(normalized)
 
 
 def _extract_entities(headline: str) -> set[str]:
     """Extract known entity names from a headline for entity-based dedup."""
-    words = set(re.findall(r'[a-z0-9]+', headline.lower()))
+    words = set(_WORD_RE.findall(headline.lower()))
     # Also try stripped forms (e.g. "openais" → "openai") for possessives
     expanded = set()
     for w in words:
@@ -304,7 +318,7 @@ def _is_non_english(article: dict) -> bool:
         return True
 
     # Headline word analysis
-    words = re.findall(r'[a-záéíóúñü]+', headline.lower())
+    words = _SPANISH_WORD_RE.findall(headline.lower())
     if len(words) < 3:
         return False
     spanish_count = sum(1 for w in words if w in _SPANISH_MARKERS)
@@ -917,7 +931,8 @@ def run_pipeline(
     briefing_date: str = None,
     output_dir: str = OUTPUT_DIR,
     collect_only: bool = False,
-    max_workers: int = 8,
+    max_workers: int = 32,
+    batch_ga: bool = False,
 ) -> dict:
     """
     Run the full Morning Intelligence pipeline.
@@ -927,6 +942,7 @@ def run_pipeline(
         output_dir: Where to save phase1 JSON and briefing HTML.
         collect_only: If True, stop after Phase 1 (data validation).
         max_workers: Concurrent article fetch threads.
+        batch_ga: Generate GA one-liners via the Message Batches API.
 
     Returns:
         Dict with phase1_json and (eventually) briefing_html path.
@@ -945,8 +961,8 @@ def run_pipeline(
     _log("PHASE 1: Collect and Validate")
     _log("-" * 40)
 
-    collector = DataCollector(max_workers=max_workers)
-    raw_results = collector.collect_all()
+    with DataCollector(max_workers=max_workers) as collector:
+        raw_results = collector.collect_all()
 
     # Categorize articles
     _log("\nCategorizing articles...")
@@ -976,8 +992,7 @@ def run_pipeline(
     # Save Phase 1 JSON (without article_text to keep file small)
     phase1_path = os.path.join(output_dir, f"phase1-{briefing_date}.json")
     phase1_clean = _strip_article_text(phase1)
-    with open(phase1_path, "w", encoding="utf-8") as f:
-        json.dump(phase1_clean, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(phase1_path, phase1_clean)
     _log(f"\n  Phase 1 JSON saved: {phase1_path}")
 
     # Print Phase 1 summary
@@ -1013,6 +1028,7 @@ def run_pipeline(
         local_articles=local,
         briefing_date=briefing_date,
         backfill_candidates=backfill,
+        batch_ga=batch_ga,
     )
 
     # Inject ticket watch from Phase 1
@@ -1033,8 +1049,7 @@ def run_pipeline(
     # Save Phase 2 JSON output (for debugging / auditing)
     phase2_path = os.path.join(output_dir, f"phase2-{briefing_date}.json")
     phase2_clean = {k: v for k, v in briefing_data.items() if k != "quality_review"}
-    with open(phase2_path, "w", encoding="utf-8") as f:
-        json.dump(phase2_clean, f, indent=2, ensure_ascii=False, default=str)
+    _write_json(phase2_path, phase2_clean)
     _log(f"  Phase 2 JSON saved: {phase2_path}")
 
     # ---- Final summary ----
@@ -1057,6 +1072,27 @@ def run_pipeline(
     }
 
 
+def _write_json(path: str, data: dict):
+    """Write pipeline JSON (indented, UTF-8, unknown types via str()).
+    Uses orjson when installed. Its output parses to the same data as
+    json.dump's but isn't byte-identical: float spelling can differ (1e-7
+    vs 1e-07) and NaN/Infinity become null. Data orjson refuses (e.g.
+    integers past 64 bits) falls back to json.dump."""
+    if HAS_ORJSON:
+        # Passthrough sends datetimes to default=str, as json.dump does
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        try:
+            payload = orjson.dumps(data, default=str, option=option)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            with open(path, "wb") as f:
+                f.write(payload)
+            return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+
+
 def _strip_article_text(phase1: dict) -> dict:
     """Remove article_text from Phase 1 JSON to keep file size small.
     Article text is kept in memory for Phase 2 but not persisted."""
@@ -1171,8 +1207,14 @@ if __name__ == "__main__":
     parser.add_argument(
         "--workers",
         type=int,
-        default=8,
-        help="Concurrent article fetch threads (default: 8)",
+        default=32,
+        help="Concurrent article fetch threads (default: 32, max 4 per host)",
+    )
+    parser.add_argument(
+        "--batch-ga",
+        action="store_true",
+        help="Generate GA one-liners via the Message Batches API "
+             "(half price; can add minutes to Phase 2).",
     )
     parser.add_argument(
         "--estimate-cost",
@@ -1192,6 +1234,7 @@ if __name__ == "__main__":
         output_dir=args.output_dir,
         collect_only=args.collect_only,
         max_workers=args.workers,
+        batch_ga=args.batch_ga,
     )
 
     # Send briefing if requested